@@ -1,12 +1,16 @@
 # local_media.py
 
 import curses
+import hashlib
 import os
 import subprocess
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import asyncio
 import logging
+import operator
 import time
-import socket
 import json
 import threading
 from pymediainfo import MediaInfo
@@ -17,10 +21,89 @@ logging.basicConfig(
     format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
+# Supported media file extensions (lower-case), checked via a single frozenset lookup.
+_MEDIA_EXTS = frozenset({'.mp4', '.mkv', '.avi', '.mov'})
+
+# Maximum number of directory listings kept in the LRU cache.
+_DIR_CACHE_SIZE = 64
+
+# Shared sort key for DirEntry lists; C-level attribute access beats a lambda.
+_BY_NAME = operator.attrgetter('name')
+
+# Lightweight stand-in for Path in file listings: the renderers only need the
+# name, and the keypress handlers only branch on is_dir. A real Path is only
+# materialized for the one entry that actually gets opened or played.
+Entry = namedtuple('Entry', 'name is_dir path')
+
+# Persistent metadata cache so a file is only ever parsed once per content.
+_MEDIAINFO_CACHE_DIR = Path.home() / '.cache' / 'media-tui' / 'mediainfo'
+_MEDIAINFO_CACHE_MAX_FILES = 256
+
+def _mediainfo_cache_file(file_path):
+    """Return the cache file for a media path, keyed by (path, size, mtime)."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    key = hashlib.sha1(
+        f"{os.path.abspath(file_path)}|{st.st_size}|{st.st_mtime_ns}".encode()
+    ).hexdigest()
+    return _MEDIAINFO_CACHE_DIR / f"{key}.json"
+
+def _prune_mediainfo_cache():
+    """Drop the oldest cache entries once the directory grows past its cap."""
+    try:
+        with os.scandir(_MEDIAINFO_CACHE_DIR) as it:
+            entries = [e for e in it if e.name.endswith('.json')]
+        if len(entries) <= _MEDIAINFO_CACHE_MAX_FILES:
+            return
+        entries.sort(key=lambda e: e.stat().st_mtime_ns)
+        for entry in entries[:len(entries) - _MEDIAINFO_CACHE_MAX_FILES]:
+            os.remove(entry.path)
+    except OSError:
+        pass
+
+def _parse_media_info(file_path):
+    """Parse container metadata with pymediainfo; runs on a worker thread.
+
+    Results are cached under ~/.cache keyed by (path, size, mtime), so a
+    previously played file skips libmediainfo entirely.
+    """
+    cache_file = _mediainfo_cache_file(file_path)
+    if cache_file is not None and cache_file.exists():
+        try:
+            with open(cache_file) as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            pass  # Corrupt or unreadable cache entry; fall through and re-parse
+
+    media_info = MediaInfo.parse(file_path)
+    general_track = media_info.general_tracks[0] if media_info.general_tracks else None
+    video_track = next((t for t in media_info.video_tracks), None)
+    audio_track = next((t for t in media_info.audio_tracks), None)
+    result = {
+        'general_track': general_track.to_data() if general_track else {},
+        'video_track': video_track.to_data() if video_track else {},
+        'audio_track': audio_track.to_data() if audio_track else {},
+    }
+
+    if cache_file is not None:
+        try:
+            _MEDIAINFO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, 'w') as f:
+                json.dump(result, f, default=str)
+            _prune_mediainfo_cache()
+        except OSError as e:
+            logging.warning(f"Could not write mediainfo cache: {e}")
+    return result
+
 class LocalMediaPlayer:
     def __init__(self, stdscr):
         self.stdscr = stdscr
-        self.media_dir = Path.home() / "Videos"
+        # Resolve the Videos root once; Path.home() reads the environment on
+        # every call and backspace handling compares against this constantly.
+        self._videos_root = Path.home() / "Videos"
+        self.media_dir = self._videos_root
         self.selected_index = 0
         self.file_list = self.get_media_directories()
         self.player_process = None
@@ -32,24 +115,76 @@ class LocalMediaPlayer:
         self.playlist = []
         self.current_media_index = None
         self.ipc_socket = None
-        self.mpv_event_thread = None
-        self.monitoring_mpv = False
+        self._monitor_future = None
+        self._ipc_writer = None  # open IPC stream to the running mpv, if any
+        # One long-lived asyncio loop on a daemon thread handles all MPV IPC
+        # monitoring, instead of spawning a fresh thread per playback.
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._loop_thread.start()
+        # Directory-listing cache: path -> (st_mtime_ns, listing), LRU-evicted.
+        self._dir_cache = OrderedDict()
+        # Previous rendered frame, used to repaint only rows that changed.
+        self._prev_view = None
+        self._prev_lines = []
+        self._prev_window = None
+        self._prev_size = None
+        # Set by the render helpers; flushed with one doupdate per input tick.
+        self._dirty = False
+        # Workers for metadata parsing so MediaInfo never blocks the UI thread.
+        self._meta_pool = ThreadPoolExecutor(max_workers=2)
+        # Pre-formatted metadata strings consumed verbatim by render_player.
+        self._metadata_lines = []
 
     def get_media_directories(self):
         """Fetch a list of directories in the Videos folder, excluding hidden ones."""
         if not self.media_dir.exists():
             return []
 
-        directories = sorted([f for f in self.media_dir.iterdir() if f.is_dir() and not f.name.startswith('.')])
-        return directories
+        # os.scandir reuses the type info returned by the kernel directory walk,
+        # avoiding one stat() per entry compared to Path.iterdir() + is_dir().
+        with os.scandir(self.media_dir) as it:
+            entries = [e for e in it if not e.name.startswith('.') and e.is_dir(follow_symlinks=False)]
+        entries.sort(key=_BY_NAME)
+        return [Entry(e.name, True, e.path) for e in entries]
 
     def get_directory_content(self):
         """Fetch a list of directories and media files in the current folder."""
         if not self.media_dir.exists():
             return []
 
-        files = sorted([f for f in self.media_dir.iterdir() if (f.is_dir() or f.suffix.lower() in ['.mp4', '.mkv', '.avi', '.mov']) and not f.name.startswith('.')])
-        return files
+        # Unchanged directories (same mtime) are served from the cache, so
+        # navigating back and forth does not re-scan the filesystem.
+        try:
+            st = os.stat(self.media_dir)
+        except OSError:
+            return []
+        key = str(self.media_dir)
+        cached = self._dir_cache.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns:
+            self._dir_cache.move_to_end(key)
+            return cached[1]
+
+        with os.scandir(self.media_dir) as it:
+            entries = [
+                e for e in it
+                if not e.name.startswith('.')
+                and (
+                    e.is_dir(follow_symlinks=False)
+                    or (
+                        e.is_file(follow_symlinks=False)
+                        and os.path.splitext(e.name)[1].lower() in _MEDIA_EXTS
+                    )
+                )
+            ]
+        entries.sort(key=_BY_NAME)
+        result = [Entry(e.name, e.is_dir(follow_symlinks=False), e.path) for e in entries]
+
+        self._dir_cache[key] = (st.st_mtime_ns, result)
+        self._dir_cache.move_to_end(key)
+        if len(self._dir_cache) > _DIR_CACHE_SIZE:
+            self._dir_cache.popitem(last=False)
+        return result
 
     def render(self, window):
         """Render different views based on the current state."""
@@ -61,27 +196,61 @@ class LocalMediaPlayer:
         elif self.current_view == "player":
             self.render_player(window)
 
-    def render_dashboard(self, window):
-        """Render the Videos directories in the dashboard view."""
-        window.clear()
-        window.box()
-        window.addstr(1, 2, "Video Directories:")
+    def _paint_frame(self, window, view, lines):
+        """Paint a frame, rewriting only rows that differ from the previous one.
 
-        # Show directories without selection
-        start_y = 3
-        for idx, item in enumerate(self.file_list):
-            display_text = f"{item.name}"
-            window.addstr(start_y + idx, 2, display_text)
+        `lines` is a list of (text, attr) tuples for the window interior,
+        starting at row 1. A full repaint (clear + box) only happens when the
+        view, window or window size changed since the last frame.
+        """
+        max_y, max_x = window.getmaxyx()
+        width = max_x - 4
+        if width <= 0 or max_y <= 2:
+            return
+
+        full_repaint = (
+            view != self._prev_view
+            or window is not self._prev_window
+            or (max_y, max_x) != self._prev_size
+        )
+        prev = [] if full_repaint else self._prev_lines
+        if full_repaint:
+            window.clear()
+            window.box()
+
+        limit = max(len(lines), len(prev))
+        for row in range(limit):
+            y = 1 + row
+            if y >= max_y - 1:
+                break
+            line = lines[row] if row < len(lines) else ("", curses.A_NORMAL)
+            if row < len(prev) and prev[row] == line:
+                continue
+            text, attr = line
+            try:
+                # Pad to the interior width so stale characters are overwritten
+                # without disturbing the box border.
+                window.addnstr(y, 2, text.ljust(width), width, attr)
+            except curses.error:
+                pass
+
+        self._prev_view = view
+        self._prev_lines = lines
+        self._prev_window = window
+        self._prev_size = (max_y, max_x)
+        window.noutrefresh()
+        self._dirty = True
 
-        window.refresh()
+    def render_dashboard(self, window):
+        """Render the Videos directories in the dashboard view."""
+        lines = [("Video Directories:", curses.A_NORMAL), ("", curses.A_NORMAL)]
+        for item in self.file_list:
+            lines.append((f"{item.name}", curses.A_NORMAL))
+        self._paint_frame(window, "dashboard", lines)
         logging.debug(f"Rendered Dashboard with directories: {self.file_list}")
 
     def render_file_explorer(self, window):
         """Render the file explorer view, allowing navigation through the Videos directory."""
-        window.clear()
-        window.box()
-        window.addstr(1, 2, "File Explorer - Navigate using j/k, Enter to open/play, Backspace to go back")
-
         max_y, max_x = window.getmaxyx()
         start_y = 3
         visible_items = max_y - start_y - 2  # Account for window borders and title
@@ -90,45 +259,82 @@ class LocalMediaPlayer:
         start_index = max(0, self.selected_index - (visible_items // 2))
         end_index = min(len(self.file_list), start_index + visible_items)
 
-        # Render only the visible portion of the file list
-        for idx in range(start_index, end_index):
-            item = self.file_list[idx]
-            display_text = f"{item.name}"
-            if idx == self.selected_index:
-                window.addstr(start_y + (idx - start_index), 2, display_text, curses.A_REVERSE)
-            else:
-                window.addstr(start_y + (idx - start_index), 2, display_text)
-
-        window.refresh()
-
-    def render_player(self, window):
-        """Render the media player interface in player mode."""
-        window.clear()
-        window.box()
-        height, width = window.getmaxyx()
-
-        # Display video information and metadata
-        title = self.current_media_info.get('title', 'Unknown Video')
-        file_path = self.current_media_info.get('file_path', '')
-        general_track = self.current_media_info.get('general_track', {})
-        video_track = self.current_media_info.get('video_track', {})
-        audio_track = self.current_media_info.get('audio_track', {})
-
-        window.addstr(2, 2, f"Now Playing: {title}")
-        window.addstr(3, 2, f"File: {file_path}")
-
-        y = 5  # Starting y position for metadata
+        lines = [
+            ("File Explorer - Navigate using j/k, Enter to open/play, Backspace to go back", curses.A_NORMAL),
+            ("", curses.A_NORMAL),
+        ]
+        # Only the visible portion of the file list is rendered
+        sel_row = self.selected_index - start_index
+        for row, item in enumerate(self.file_list[start_index:end_index]):
+            attr = curses.A_REVERSE if row == sel_row else curses.A_NORMAL
+            lines.append((item.name, attr))
+        self._paint_frame(window, "explorer", lines)
+
+    def _paint_row(self, window, idx, start_index, attr):
+        """Paint a single explorer row and keep the frame cache in sync."""
+        max_y, max_x = window.getmaxyx()
+        width = max_x - 4
+        y = 3 + (idx - start_index)
+        if width <= 0 or y >= max_y - 1:
+            return
+        text = f"{self.file_list[idx].name}"
+        try:
+            window.addnstr(y, 2, text.ljust(width), width, attr)
+        except curses.error:
+            pass
+        frame_row = y - 1
+        if frame_row < len(self._prev_lines):
+            self._prev_lines[frame_row] = (text, attr)
+
+    def _move_selection(self, old_index):
+        """Repaint only the two rows affected by a j/k move.
+
+        Falls back to a full explorer render when the viewport scrolled or no
+        explorer frame is on screen yet.
+        """
+        window = self.window
+        if window is None or self._prev_view != "explorer":
+            self.render_file_explorer(window)
+            return
+        max_y, _ = window.getmaxyx()
+        visible_items = max_y - 5
+        old_start = max(0, old_index - (visible_items // 2))
+        new_start = max(0, self.selected_index - (visible_items // 2))
+        if old_start != new_start:
+            self.render_file_explorer(window)
+            return
+        self._paint_row(window, old_index, new_start, curses.A_NORMAL)
+        self._paint_row(window, self.selected_index, new_start, curses.A_REVERSE)
+        window.noutrefresh()
+        self._dirty = True
+
+    def _build_metadata_lines(self):
+        """Format the player metadata block once, whenever metadata changes.
+
+        render_player then just iterates the prebuilt strings, with no
+        arithmetic or dict lookups per frame.
+        """
+        info = self.current_media_info
+        general_track = info.get('general_track', {})
+        video_track = info.get('video_track', {})
+        audio_track = info.get('audio_track', {})
+
+        body = [
+            f"Now Playing: {info.get('title', 'Unknown Video')}",
+            f"File: {info.get('file_path', '')}",
+            "",
+        ]
+        if info.get('_loading'):
+            body.append("Loading metadata...")
 
         # General metadata
         duration = general_track.get('duration')
         file_size = general_track.get('file_size')
         if duration:
             duration_sec = float(duration) / 1000
-            window.addstr(y, 2, f"Duration: {duration_sec:.2f} sec")
-            y += 1
+            body.append(f"Duration: {duration_sec:.2f} sec")
         if file_size:
-            window.addstr(y, 2, f"File Size: {int(file_size) / (1024 * 1024):.2f} MB")
-            y += 1
+            body.append(f"File Size: {int(file_size) / (1024 * 1024):.2f} MB")
 
         # Video metadata
         width_v = video_track.get('width')
@@ -136,81 +342,103 @@ class LocalMediaPlayer:
         frame_rate = video_track.get('frame_rate')
         codec = video_track.get('format')
         if codec:
-            window.addstr(y, 2, f"Video Codec: {codec}")
-            y += 1
+            body.append(f"Video Codec: {codec}")
         if width_v and height_v:
-            window.addstr(y, 2, f"Resolution: {width_v}x{height_v}")
-            y += 1
+            body.append(f"Resolution: {width_v}x{height_v}")
         if frame_rate:
-            window.addstr(y, 2, f"Frame Rate: {frame_rate} fps")
-            y += 1
+            body.append(f"Frame Rate: {frame_rate} fps")
 
         # Audio metadata
         audio_codec = audio_track.get('format')
         channels = audio_track.get('channel_s')
         sample_rate = audio_track.get('sampling_rate')
         if audio_codec:
-            window.addstr(y, 2, f"Audio Codec: {audio_codec}")
-            y += 1
+            body.append(f"Audio Codec: {audio_codec}")
         if channels:
-            window.addstr(y, 2, f"Channels: {channels}")
-            y += 1
+            body.append(f"Channels: {channels}")
         if sample_rate:
-            window.addstr(y, 2, f"Sample Rate: {sample_rate} Hz")
-            y += 1
+            body.append(f"Sample Rate: {sample_rate} Hz")
 
-        window.addstr(height - 3, 2, "Press Backspace to return to File Explorer")
-        window.refresh()
+        self._metadata_lines = body
+
+    def render_player(self, window):
+        """Render the media player interface in player mode."""
+        height, width = window.getmaxyx()
+
+        lines = [("", curses.A_NORMAL)]  # row 1 left blank, body starts at row 2
+        lines.extend((text, curses.A_NORMAL) for text in self._metadata_lines)
+        # Pin the footer to its usual row near the bottom border
+        footer_row = height - 4  # frame rows start at y=1
+        while len(lines) < footer_row:
+            lines.append(("", curses.A_NORMAL))
+        lines.append(("Press Backspace to return to File Explorer", curses.A_NORMAL))
+        self._paint_frame(window, "player", lines)
 
     def handle_keypress(self, key):
         """Handle keypress actions based on current view."""
+        handled = False
         if self.current_view == "dashboard" and key == ord('\n'):
             # Switch to explorer when Enter is pressed
             self.current_view = "explorer"
-            self.media_dir = Path.home() / "Videos"
+            self.media_dir = self._videos_root
             self.file_list = self.get_directory_content()
             self.selected_index = 0
-            return True
+            handled = True
         elif self.current_view == "explorer":
-            return self.handle_explorer_keypress(key)
+            handled = self.handle_explorer_keypress(key)
         elif self.current_view == "player":
-            return self.handle_player_keypress(key)
-        return False
+            handled = self.handle_player_keypress(key)
+
+        # Flush all pending noutrefresh output in one terminal write burst.
+        if self._dirty:
+            curses.doupdate()
+            self._dirty = False
+        return handled
 
     def handle_explorer_keypress(self, key):
         """Handle keypress actions in the file explorer."""
         handled = False
         if key == ord('j'):
+            old_index = self.selected_index
             if self.selected_index < len(self.file_list) - 1:
                 self.selected_index += 1
-            self.render_file_explorer(self.window)
+            self._move_selection(old_index)
             handled = True
         elif key == ord('k'):
+            old_index = self.selected_index
             if self.selected_index > 0:
                 self.selected_index -= 1
-            self.render_file_explorer(self.window)
+            self._move_selection(old_index)
             handled = True
         elif key == ord('\n'):  # Enter key to open directory or play file
             selected_item = self.file_list[self.selected_index]
             logging.debug(f"Selected Item: {selected_item}")
-            if selected_item.is_dir():
-                self.media_dir = selected_item
+            if selected_item.is_dir:
+                self.media_dir = Path(selected_item.path)
                 self.file_list = self.get_directory_content()
                 self.selected_index = 0
                 logging.debug(f"Opened directory: {self.media_dir}")
                 self.render(self.window)
             else:
-                # Build playlist
-                self.playlist = [f for f in self.file_list if f.is_file() and f.suffix.lower() in ['.mp4', '.mkv', '.avi', '.mov']]
-                # Find index of selected item in playlist
-                self.current_media_index = self.playlist.index(selected_item)
+                # Build playlist of path strings, recording the selected item's
+                # position in the same pass instead of a separate .index() scan
+                playlist = []
+                current_media_index = 0
+                for f in self.file_list:
+                    if f.is_dir or os.path.splitext(f.name)[1].lower() not in _MEDIA_EXTS:
+                        continue
+                    if f is selected_item:
+                        current_media_index = len(playlist)
+                    playlist.append(f.path)
+                self.playlist = playlist
+                self.current_media_index = current_media_index
                 self.play_media_file(self.playlist[self.current_media_index])
                 self.current_view = "player"
                 logging.debug(f"Playing file: {selected_item}")
                 self.render(self.window)
             handled = True
         elif key in (curses.KEY_BACKSPACE, ord('\b'), 127):
-            if self.media_dir == Path.home() / "Videos":
+            if self.media_dir == self._videos_root:
                 self.current_view = "dashboard"
                 self.file_list = self.get_media_directories()
             else:
@@ -229,154 +457,202 @@ class LocalMediaPlayer:
             return True
         return False
 
+    def _set_current_media(self, file_path):
+        """Publish placeholder info for a new track and kick off metadata parse."""
+        # Show the player immediately; metadata fills in when the worker is done.
+        self.current_media_info = {
+            'title': str(file_path.stem),
+            'file_path': str(file_path),
+            'general_track': {},
+            'video_track': {},
+            'audio_track': {},
+            '_loading': True,
+        }
+        self._build_metadata_lines()
+        future = self._meta_pool.submit(_parse_media_info, str(file_path))
+        future.add_done_callback(
+            lambda f, path=str(file_path): self._on_metadata_ready(path, f)
+        )
+
+    def _send_ipc_command(self, command):
+        """Queue a JSON IPC command to mpv on the background loop."""
+        writer = self._ipc_writer
+        if writer is None:
+            return False
+        payload = (json.dumps({'command': command}) + '\n').encode('utf-8')
+
+        def _send():
+            try:
+                writer.write(payload)
+            except Exception as e:
+                logging.error(f"Error sending IPC command: {e}")
+
+        self._loop.call_soon_threadsafe(_send)
+        return True
+
+    def _load_file_in_running_mpv(self, file_path):
+        """Switch tracks over the existing mpv instance; True on success."""
+        if not (self.player_process and self.player_process.poll() is None):
+            return False
+        if not self._send_ipc_command(['loadfile', str(file_path)]):
+            return False
+        self._set_current_media(Path(file_path))
+        self.playback_start_time = time.time()
+        self.player_paused = False
+        return True
+
     def play_media_file(self, file_path):
         """Play the selected media file using MPV."""
+        file_path = Path(file_path)  # playlist entries are plain path strings
+
+        # Reuse the running mpv and its IPC connection when possible: track
+        # changes become a loadfile command instead of a process respawn.
+        if self._load_file_in_running_mpv(file_path):
+            return
+
         if self.player_process and self.player_process.poll() is None:
             self.player_process.terminate()  # Stop any currently playing media
 
         # Generate a unique IPC socket path
         self.ipc_socket = f"/tmp/mpv_socket_{os.getpid()}"
 
-        # Use MPV to play the file with IPC enabled and full-screen mode
+        # Use MPV to play the file with IPC enabled and full-screen mode.
+        # --idle keeps the process alive between tracks so it can be reused.
         self.player_process = subprocess.Popen(
-            ["mpv", "--fs", "--quiet", f"--input-ipc-server={self.ipc_socket}", str(file_path)],
+            ["mpv", "--fs", "--quiet", "--idle=yes", f"--input-ipc-server={self.ipc_socket}", str(file_path)],
             stdin=subprocess.PIPE,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL
         )
 
-        # **Ensure media_title is defined here**
-        media_title = file_path.stem  # Extract the file name without extension
-
-        # Extract media info using pymediainfo
-        try:
-            media_info = MediaInfo.parse(str(file_path))
-            general_track = media_info.general_tracks[0] if media_info.general_tracks else None
-            video_track = next((t for t in media_info.video_tracks), None)
-            audio_track = next((t for t in media_info.audio_tracks), None)
-        except Exception as e:
-            logging.error(f"Error extracting media info: {e}")
-            general_track = video_track = audio_track = None
-
-        # Store metadata
-        self.current_media_info = {
-            'title': str(media_title),
-            'file_path': str(file_path),
-            'general_track': general_track.to_data() if general_track else {},
-            'video_track': video_track.to_data() if video_track else {},
-            'audio_track': audio_track.to_data() if audio_track else {},
-        }
-
+        self._set_current_media(file_path)
         self.playback_start_time = time.time()
         self.player_paused = False
 
-        # Start monitoring MPV events
-        self.monitoring_mpv = True
-        self.mpv_event_thread = threading.Thread(target=self.monitor_mpv_events)
-        self.mpv_event_thread.start()
+        # Start monitoring MPV events on the shared background loop
+        self._monitor_future = asyncio.run_coroutine_threadsafe(
+            self._monitor_mpv(), self._loop
+        )
+        # Edge-triggered exit handling: no polling from the UI tick
+        asyncio.run_coroutine_threadsafe(
+            self._watch_player_exit(self.player_process), self._loop
+        )
 
-    def monitor_mpv_events(self):
-        """Monitor MPV events to detect playback completion or user quit."""
+    def _on_metadata_ready(self, file_path, future):
+        """Store parsed metadata; called on a worker thread, so only mutate state."""
+        try:
+            tracks = future.result()
+        except Exception as e:
+            logging.error(f"Error extracting media info: {e}")
+            tracks = {'general_track': {}, 'video_track': {}, 'audio_track': {}}
+        if self.current_media_info.get('file_path') != file_path:
+            return  # A newer track started while we were parsing
+        self.current_media_info.update(tracks)
+        self.current_media_info.pop('_loading', None)
+        self._build_metadata_lines()
+
+    async def _connect_mpv_ipc(self, retries=100, delay=0.1):
+        """Connect to the MPV IPC socket, retrying until mpv has created it."""
+        for _ in range(retries):
+            try:
+                return await asyncio.open_unix_connection(self.ipc_socket)
+            except (FileNotFoundError, ConnectionRefusedError):
+                await asyncio.sleep(delay)
+        return None, None
+
+    async def _monitor_mpv(self):
+        """Follow the MPV IPC event stream; runs on the background event loop."""
         if not self.ipc_socket:
             return
 
-        # Wait for the IPC socket to be available and ready
-        timeout = 10  # Increase timeout to 10 seconds
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            if os.path.exists(self.ipc_socket):
-                try:
-                    test_client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-                    test_client.connect(self.ipc_socket)
-                    test_client.close()
-                    break  # Connection successful
-                except ConnectionRefusedError:
-                    time.sleep(0.1)
-            else:
-                time.sleep(0.1)
-        else:
+        reader, writer = await self._connect_mpv_ipc()
+        if reader is None:
             logging.error("MPV IPC socket not available or connection refused.")
             return
 
+        self._ipc_writer = writer
         try:
-            client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            client.connect(self.ipc_socket)
-            client.settimeout(1.0)
-
-            # Send a request to observe property changes
-            #command = {'command': ['observe_property', 1, 'eof-reached']}
-            #client.sendall((json.dumps(command) + '\n').encode('utf-8'))
-
-            buffer = ''
-            while self.monitoring_mpv:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break  # mpv closed the socket (EOF)
+                line = line.strip()
+                if not line:
+                    continue
                 try:
-                    data = client.recv(4096).decode('utf-8')
-                    if data:
-                        buffer += data
-                        while '\n' in buffer:
-                            line, buffer = buffer.split('\n', 1)
-                            if line.strip() == '':
-                                continue
-                            try:
-                                message = json.loads(line.strip())
-                            except json.JSONDecodeError as e:
-                                logging.error(f"JSON decode error: {e}")
-                                continue
-                            event = message.get('event')
-                            if event == 'idle':
-                                # Playback ended naturally
-                                self.handle_playback_end()
-                                return  # Exit the thread
-                    else:
-                        time.sleep(0.1)
-                except socket.timeout:
+                    # json.loads accepts bytes; no per-line str decode needed
+                    message = json.loads(line)
+                except json.JSONDecodeError as e:
+                    logging.error(f"JSON decode error: {e}")
                     continue
-                except Exception as e:
-                    logging.error(f"Error in MPV event monitoring: {e}")
-                    break
-
-            client.close()
+                event = message.get('event')
+                if event == 'idle':
+                    # Playback ended naturally; keep monitoring if the
+                    # playlist advanced on this same mpv instance
+                    if not self.handle_playback_end():
+                        return
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            logging.error(f"Error connecting to MPV IPC socket: {e}")
+            logging.error(f"Error in MPV event monitoring: {e}")
+        finally:
+            if self._ipc_writer is writer:
+                self._ipc_writer = None
+            writer.close()
 
     def handle_playback_end(self):
-        """Handle actions after playback ends naturally."""
-        # Clean up current playback
-        self.stop_media(clean_ipc=False)  # We will reuse the IPC socket
+        """Handle actions after playback ends naturally.
+
+        Returns True when the monitor should keep following the current mpv
+        instance (playlist advanced via loadfile, or mpv is idling), False
+        when monitoring for this instance is over.
+        """
+        if (self.playlist and self.current_media_index is not None
+                and self.current_media_index + 1 < len(self.playlist)):
+            self.current_media_index += 1
+            next_path = self.playlist[self.current_media_index]
+            if self._load_file_in_running_mpv(next_path):
+                return True
+            # mpv went away mid-advance; fall back to a fresh spawn
+            self.play_media_file(next_path)
+            return False
+
+        # No more media in playlist: leave mpv idling for the next loadfile
+        # and return to the player view
+        self.playback_start_time = None
+        self.player_paused = False
+        self.current_view = "player"
+        self.render(self.window)
+        return True
+
+    async def _watch_player_exit(self, proc):
+        """Wait for the mpv process to exit and handle it once, off the UI thread."""
+        loop = asyncio.get_running_loop()
+        return_code = await loop.run_in_executor(None, proc.wait)
+        self._on_player_exited(proc, return_code)
+
+    def _on_player_exited(self, proc, return_code):
+        """Handle an mpv exit; replaces the old per-tick poll()."""
+        if self.player_process is not proc:
+            return  # A newer player instance replaced this one
+        self._cancel_monitor()
+        self.player_process = None
+        self.playback_start_time = None
+        self.player_paused = False
 
-        if self.playlist and self.current_media_index is not None:
-            if self.current_media_index + 1 < len(self.playlist):
-                self.current_media_index += 1
-                self.play_media_file(self.playlist[self.current_media_index])
-            else:
-                # No more media in playlist, return to player view
-                self.current_view = "player"
-                self.render(self.window)
-        else: 
+        if return_code == 0:
+            # Assume natural end (since we handle natural end via events)
+            pass
+        else:
+            # User quit MPV
             self.current_view = "player"
             self.render(self.window)
 
-    def check_playback_status(self):
-        """Check if the media has finished playing or was stopped by the user."""
-        if self.player_process and self.player_process.poll() is not None:
-            # Player exited
-            self.monitoring_mpv = False
-            if self.mpv_event_thread and self.mpv_event_thread.is_alive():
-                self.mpv_event_thread.join()
-            return_code = self.player_process.returncode
-            self.player_process = None
-            self.playback_start_time = None
-            self.player_paused = False
-
-            if return_code == 0:
-                # Assume natural end (since we handle natural end via events)
-                #self.current_view = "player"
-                #self.render(self.window)
-                pass
-            else:
-                # User quit MPV
-                self.current_view = "player"
-                self.render(self.window)
+    def _cancel_monitor(self):
+        """Cancel the IPC monitor task; no join needed, cancellation is async."""
+        if self._monitor_future is not None:
+            self._monitor_future.cancel()
+            self._monitor_future = None
 
     def stop_media(self, clean_ipc=True):
         """Stop the currently playing media."""
@@ -389,10 +665,11 @@ class LocalMediaPlayer:
         self.playback_start_time = None
         self.player_paused = False
         self.current_media_info = {}
-        self.monitoring_mpv = False
-        if self.mpv_event_thread and self.mpv_event_thread.is_alive():
-            self.mpv_event_thread.join()
+        self._metadata_lines = []
+        self._cancel_monitor()
 
     def cleanup(self):
         """Clean up resources before exiting."""
         self.stop_media()
+        self._meta_pool.shutdown(wait=False)
+        self._loop.call_soon_threadsafe(self._loop.stop)
@@ -1,17 +1,21 @@
 # local_music.py
 
 import curses
+import json
 import os
+import socket
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import logging
 import time
-from mutagen import File as MutagenFile
-import signal
-from mutagen.id3 import ID3, APIC
-from mutagen.mp4 import MP4Cover
-from PIL import Image
-import io
+# Prefer the Rust-backed mutagen-rs when available: same File/tag surface,
+# much faster parsing. Fall back to classic mutagen otherwise.
+try:
+    from mutagen_rs import File as MutagenFile
+except ImportError:
+    from mutagen import File as MutagenFile
+import numpy as np
 
 logging.basicConfig(
     filename="local_music_debug.log",
@@ -19,10 +23,88 @@ logging.basicConfig(
     format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
+# Supported audio file extensions (lower-case), checked via one set lookup.
+_AUDIO_EXTS = frozenset({'.mp3', '.flac', '.wav', '.m4a', '.mp4'})
+
+# Brightness-to-character table for ASCII album art, built once so the
+# per-frame conversion is a single fancy-index with no allocations.
+_ASCII_CHARS = np.array(list("@#S%?*+;:,."), dtype='U1')
+_ASCII_N = len(_ASCII_CHARS)
+
+# Optional Numba JIT for the pixel-quantization kernel; the NumPy fallback
+# has identical semantics when numba is not installed.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+def _quantize(arr_u8, n_chars):
+    """Scale uint8 grayscale pixels to char-table indices."""
+    return (arr_u8.astype(np.uint16) * (n_chars - 1)) // 255
+
+if njit is not None:
+    _quantize = njit(cache=True)(_quantize)
+    # Compile at import with a dummy call so the first player frame
+    # does not pay the JIT latency
+    _quantize(np.zeros((1, 1), dtype=np.uint8), 2)
+
+def _extract_apic(tags):
+    """Pull embedded ID3 art: frame objects via getall, else dict-backed keys."""
+    getall = getattr(tags, 'getall', None)
+    if getall is not None:
+        # getall('APIC') matches every APIC frame regardless of its
+        # description, which the 'APIC:<desc>' dict keys would hide
+        frames = getall('APIC')
+        return frames[0].data if frames else None
+    for key, tag in tags.items():
+        if key.startswith('APIC'):
+            return getattr(tag, 'data', tag)
+    return None
+
+def _extract_covr(tags):
+    if 'covr' in tags:
+        return bytes(tags['covr'][0])
+    return None
+
+def _extract_flac_pic(tags):
+    if 'METADATA_BLOCK_PICTURE' in tags:
+        pic = tags['METADATA_BLOCK_PICTURE'][0]
+        return getattr(pic, 'data', pic)
+    return None
+
+# Album-art extraction dispatched on the (lower-cased) suffix, computed once
+# per track instead of re-testing it across chained elif branches.
+_ART_EXTRACTORS = {
+    '.mp3': _extract_apic,
+    '.m4a': _extract_covr,
+    '.mp4': _extract_covr,
+    '.flac': _extract_flac_pic,
+}
+
+def _extract_tags(audio, file_path):
+    """Normalize tag access across the mutagen and mutagen-rs backends.
+
+    mutagen exposes ID3 frame objects with a getall() accessor and .data
+    attributes, while mutagen-rs returns plain dict-like tags. Returns a
+    (title, album, art_bytes) tuple with filename/folder-name fallbacks.
+    """
+    tags = audio.tags if audio is not None else None
+    if not tags:
+        return file_path.stem, file_path.parent.name, None
+
+    title = tags.get('TIT2', tags.get('title', file_path.stem))
+    album = tags.get('TALB', tags.get('album', file_path.parent.name))
+
+    extractor = _ART_EXTRACTORS.get(file_path.suffix.lower())
+    art_data = extractor(tags) if extractor else None
+    return title, album, art_data
+
 class LocalMusicPlayer:
     def __init__(self, stdscr):
         self.stdscr = stdscr
-        self.music_dir = Path.home() / "Music"
+        # Resolve the Music root once; reused for every backspace compare
+        self._music_root = Path.home() / "Music"
+        self.music_dir = self._music_root
         self.selected_index = 0
         self.file_list = self.get_music_directories()  # Start with directories only
         self.player_process = None
@@ -34,23 +116,148 @@ class LocalMusicPlayer:
         self.pause_time = None
         self.playlist = []
         self.current_track_index = None
+        # Prefetched per-track metadata keyed by path, filled by the executor
+        # as soon as a playlist is built so track switches skip parsing.
+        self._meta_cache = {}
+        self._meta_executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+        # Rendered ASCII art keyed by (id(image), width); only recomputed on
+        # track change or terminal resize.
+        self._art_cache = {}
+        # Player damage tracking: static chrome (art/title/controls) is only
+        # redrawn on track change or window change; per-tick redraws touch
+        # just the progress rows.
+        self._track_changed = False
+        self._player_window = None
+        self._player_size = None
+        self._progress_pos = None
+        # One long-lived idle mpv instance; tracks are swapped over IPC
+        # instead of spawning a process per track.
+        self._mpv_socket_path = f"/tmp/mpv_music_socket_{os.getpid()}"
+        self._mpv_sock = None
+
+    def _ensure_mpv(self):
+        """Spawn the shared idle mpv instance if it is not already running."""
+        if self.player_process and self.player_process.poll() is None:
+            return
+        self._close_mpv_socket()
+        self.player_process = subprocess.Popen(
+            ["mpv", "--no-video", "--quiet", "--idle=yes",
+             f"--input-ipc-server={self._mpv_socket_path}"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
+    def _connect_mpv(self, retries=50, delay=0.1):
+        """Connect to the mpv IPC socket, waiting for mpv to create it."""
+        for _ in range(retries):
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(self._mpv_socket_path)
+                self._mpv_sock = sock
+                return sock
+            except (FileNotFoundError, ConnectionRefusedError):
+                sock.close()
+                time.sleep(delay)
+        return None
+
+    def _close_mpv_socket(self):
+        if self._mpv_sock is not None:
+            try:
+                self._mpv_sock.close()
+            except OSError:
+                pass
+            self._mpv_sock = None
+
+    def _mpv_send(self, command):
+        """Send one JSON IPC command to the shared mpv instance."""
+        payload = (json.dumps({"command": command}) + "\n").encode("utf-8")
+        for _ in range(2):  # one retry after reconnecting on a dead socket
+            sock = self._mpv_sock or self._connect_mpv()
+            if sock is None:
+                logging.error("Could not reach mpv IPC socket")
+                return False
+            try:
+                sock.sendall(payload)
+                return True
+            except OSError:
+                self._close_mpv_socket()
+        return False
+
+    def _parse_metadata(self, file_path):
+        """Parse tags and album art for one track, caching the result."""
+        cached = self._meta_cache.get(file_path)
+        if cached is not None:
+            return cached
+
+        audio = MutagenFile(str(file_path))
+        track_length = audio.info.length if audio.info else None
+        track_title, album_name, album_art_data = _extract_tags(audio, file_path)
+
+        # Keep the raw art bytes; decoding happens lazily the first time the
+        # player view actually needs the image (see _album_art_image)
+        info = {
+            'title': str(track_title),
+            'album': str(album_name),
+            'length': track_length,
+            'album_art_data': album_art_data,
+            'album_art_image': None,
+            'file_path': file_path
+        }
+        self._meta_cache[file_path] = info
+        return info
+
+    def _album_art_image(self):
+        """Decode the current track's album art on first use and cache it.
+
+        Pillow is imported here rather than at module top so tracks skipped
+        from the explorer never pay the import or the JPEG decode; only a
+        rendered player frame triggers it.
+        """
+        info = self.current_track_info
+        image = info.get('album_art_image')
+        if image is not None:
+            return image
+        art_data = info.get('album_art_data')
+        if not art_data:
+            return None
+        try:
+            import io
+            from PIL import Image
+            image = Image.open(io.BytesIO(art_data))
+        except Exception as e:
+            logging.error(f"Error processing album art: {e}")
+            info['album_art_data'] = None  # don't retry a broken blob
+            return None
+        info['album_art_image'] = image
+        return image
 
     def get_music_directories(self):
         """Fetch a list of directories in the Music folder, excluding hidden ones."""
-        if not self.music_dir.exists():
+        # scandir answers is_dir from the directory read itself instead of a
+        # stat per entry; FileNotFoundError replaces the up-front exists()
+        try:
+            with os.scandir(self.music_dir) as it:
+                return sorted(
+                    (Path(e.path) for e in it
+                     if not e.name.startswith('.') and e.is_dir(follow_symlinks=False)),
+                    key=lambda p: p.name)
+        except FileNotFoundError:
             return []
 
-        directories = sorted([f for f in self.music_dir.iterdir() if f.is_dir() and not f.name.startswith('.')])
-        return directories
-
     def get_directory_content(self):
         """Fetch a list of directories and music files in the current folder."""
-        if not self.music_dir.exists():
+        try:
+            with os.scandir(self.music_dir) as it:
+                return sorted(
+                    (Path(e.path) for e in it
+                     if not e.name.startswith('.')
+                     and (e.is_dir(follow_symlinks=False)
+                          or os.path.splitext(e.name)[1].lower() in _AUDIO_EXTS)),
+                    key=lambda p: p.name)
+        except FileNotFoundError:
             return []
 
-        files = sorted([f for f in self.music_dir.iterdir() if (f.is_dir() or f.suffix in ['.mp3', '.flac', '.wav']) and not f.name.startswith('.')])
-        return files
-
     def render(self, window):
         """Render different views based on the current state."""
         self.window = window  # Store the current window
@@ -67,25 +274,32 @@ class LocalMusicPlayer:
         window.box()
         window.addstr(1, 2, "Music Directories:")
 
-        # Show directories without selection
+        # Show directories without selection, limited to what fits on screen
+        # (same visible-slice idea as render_file_explorer)
+        max_y, _ = window.getmaxyx()
         start_y = 3
-        for idx, item in enumerate(self.file_list):
+        visible = max(0, max_y - start_y - 1)
+        for idx, item in enumerate(self.file_list[:visible]):
             display_text = f"{item.name}"
             window.addstr(start_y + idx, 2, display_text)
 
-        window.refresh()
+        window.noutrefresh()
         logging.debug(f"Rendered Dashboard with directories: {self.file_list}")
     
     def stop_media(self):
-        """Stop the currently playing music."""
+        """Stop the currently playing music and tear down the mpv instance."""
         if self.player_process and self.player_process.poll() is None:
             self.player_process.terminate()
             self.player_process.wait()
             self.player_process = None
+        self._close_mpv_socket()
+        if os.path.exists(self._mpv_socket_path):
+            os.remove(self._mpv_socket_path)
         self.playback_start_time = None
         self.player_paused = False
         self.current_track_index = None
         self.current_track_info = {}
+        self._art_cache.clear()
 
 
     def render_file_explorer(self, window):
@@ -111,10 +325,22 @@ class LocalMusicPlayer:
             else:
                 window.addstr(start_y + (idx - start_index), 2, display_text)
 
-        window.refresh()
+        window.noutrefresh()
 
     def render_player(self, window):
         """Render the music player interface in player mode."""
+        height, width = window.getmaxyx()
+        if (self._track_changed or window is not self._player_window
+                or (height, width) != self._player_size):
+            self._render_player_static(window)
+            self._track_changed = False
+            self._player_window = window
+            self._player_size = (height, width)
+        self._render_player_progress(window)
+        window.noutrefresh()
+
+    def _render_player_static(self, window):
+        """Draw the player chrome that only changes on track or window change."""
         window.clear()
         window.box()
         height, width = window.getmaxyx()
@@ -122,34 +348,20 @@ class LocalMusicPlayer:
         # Get track info
         track_title = self.current_track_info.get('title', 'Unknown Track')
         album_name = self.current_track_info.get('album', 'Unknown Album')
-        track_length = self.current_track_info.get('length', 0)
-        album_art_image = self.current_track_info.get('album_art_image', None)
-        elapsed_time = time.time() - self.playback_start_time if self.playback_start_time else 0
-        if self.player_paused and self.pause_time:
-            elapsed_time = self.pause_time - self.playback_start_time
-
-        # Format times
-        def format_time(seconds):
-            mins = int(seconds) // 60
-            secs = int(seconds) % 60
-            return f"{mins}:{secs:02d}"
-
-        elapsed_str = format_time(elapsed_time)
-        total_str = format_time(track_length)
-
-        # Progress Bar
-        progress_bar_length = width - 4
-        progress = elapsed_time / track_length if track_length else 0
-        filled_length = int(progress_bar_length * progress)
-        progress_bar = '[' + '#' * filled_length + ' ' * (progress_bar_length - filled_length) + ']'
+        album_art_image = self._album_art_image()
 
         # Album Art Display
         album_art_width = min(40, width - 4)  # Adjust width as needed
         art_x = 2
         art_y = 2
+        ascii_art = []
 
         if album_art_image:
-            ascii_art = self.get_ascii_art(album_art_image, album_art_width)
+            art_key = (id(album_art_image), album_art_width)
+            ascii_art = self._art_cache.get(art_key)
+            if ascii_art is None:
+                ascii_art = self.get_ascii_art(album_art_image, album_art_width)
+                self._art_cache[art_key] = ascii_art
             for i, line in enumerate(ascii_art):
                 if art_y + i < height - 10:
                     window.addstr(art_y + i, art_x, line)
@@ -157,15 +369,15 @@ class LocalMusicPlayer:
             # Placeholder for no album art
             window.addstr(art_y + 5, art_x + album_art_width // 2 - 5, "No Album Art")
 
-        # Now Playing Info
+        # Now Playing Info; remember where the progress rows live so the
+        # per-tick render can overwrite just those two lines
         info_x = art_x
         info_y = art_y + (len(ascii_art) if album_art_image else 10) + 1
+        self._progress_pos = None
         if info_y + 5 < height - 5:
             window.addstr(info_y, info_x, f"Now Playing: {track_title}")
             window.addstr(info_y + 1, info_x, f"Album: {album_name}")
-            # Display progress bar and times
-            window.addstr(info_y + 3, info_x, progress_bar)
-            window.addstr(info_y + 4, info_x, f"{elapsed_str} / {total_str}")
+            self._progress_pos = (info_y + 3, info_y + 4, info_x)
 
         # Display controls
         controls_text = " [B] Back  [P] Play/Pause  [N] Next "
@@ -184,14 +396,40 @@ class LocalMusicPlayer:
             btn_width = len(label)
             self.button_regions[action] = (btn_y, btn_x, btn_width)
 
-        window.refresh()
+    def _render_player_progress(self, window):
+        """Overwrite only the progress bar and elapsed/total time rows."""
+        if self._progress_pos is None:
+            return
+        height, width = window.getmaxyx()
+
+        track_length = self.current_track_info.get('length') or 0
+        elapsed_time = time.time() - self.playback_start_time if self.playback_start_time else 0
+        if self.player_paused and self.pause_time:
+            elapsed_time = self.pause_time - self.playback_start_time
+
+        # Format times
+        def format_time(seconds):
+            mins = int(seconds) // 60
+            secs = int(seconds) % 60
+            return f"{mins}:{secs:02d}"
+
+        # Progress Bar
+        progress_bar_length = width - 4
+        progress = elapsed_time / track_length if track_length else 0
+        filled_length = int(progress_bar_length * progress)
+        progress_bar = '[' + '#' * filled_length + ' ' * (progress_bar_length - filled_length) + ']'
+
+        bar_y, time_y, info_x = self._progress_pos
+        window.addstr(bar_y, info_x, progress_bar)
+        # Trailing spaces clear leftovers when the time string shrinks
+        window.addstr(time_y, info_x, f"{format_time(elapsed_time)} / {format_time(track_length)}   ")
 
     def handle_keypress(self, key):
         """Handle keypress actions based on current view."""
         if self.current_view == "dashboard" and key == ord('\n'):
             # Switch to explorer when Enter is pressed
             self.current_view = "explorer"
-            self.music_dir = Path.home() / "Music"
+            self.music_dir = self._music_root
             self.file_list = self.get_directory_content()
             self.selected_index = 0
             return True
@@ -233,9 +471,14 @@ class LocalMusicPlayer:
                 logging.debug(f"Opened directory: {self.music_dir}")
             else:
                 # build a fucking playlist
-                self.playlist = [f for f in self.file_list if f.is_file() and f.suffix in ['.mp3', '.flac', '.wav']]
+                self.playlist = [f for f in self.file_list if f.is_file() and f.suffix.lower() in _AUDIO_EXTS]
                 # Find index of selected item in the fucking playlist
                 self.current_track_index = self.playlist.index(selected_item)
+                # Warm the metadata cache for the whole playlist in parallel
+                # so next/previous track switches become dict lookups
+                self._meta_cache = {}
+                for path in self.playlist:
+                    self._meta_executor.submit(self._parse_metadata, path)
                 self.play_music_file(self.playlist[self.current_track_index])
                 self.current_view = "player"
                 logging.debug(f"Playing file: {selected_item}")
@@ -258,7 +501,7 @@ class LocalMusicPlayer:
         #    self.render_file_explorer(self.stdscr)
         elif key in (curses.KEY_BACKSPACE, ord('\b'), 127):
             logging.debug(f"Backspace pressed. Current Directory: {self.music_dir}")
-            if self.music_dir == Path.home() / "Music":
+            if self.music_dir == self._music_root:
                 self.current_view = "dashboard"
                 self.file_list = self.get_music_directories()
                 logging.debug("Back to dashboard view (root Music directory).")
@@ -307,90 +550,49 @@ class LocalMusicPlayer:
             return True
         return False
 
-    def get_ascii_art(self, img, width):
-        """Convert an image to ASCII art."""
+    def _gray_array(self, img, width):
+        """Return the resized grayscale pixel array for an image.
+
+        The array for the current track is cached on current_track_info keyed
+        by width, so the PIL resize/convert allocations happen once per
+        (track, terminal width) rather than per conversion.
+        """
+        info = self.current_track_info
+        is_current = info.get('album_art_image') is img
+        if is_current:
+            cached = info.get('album_art_gray')
+            if cached is not None and cached[0] == width:
+                return cached[1]
+
         # Resize image maintaining aspect ratio
         aspect_ratio = img.height / img.width
         new_height = int(aspect_ratio * width * 0.55)  # Adjust for terminal character dimensions
-        img = img.resize((width, new_height))
-        img = img.convert('L')  # Convert to grayscale
+        arr = np.asarray(img.resize((width, new_height)).convert('L'), dtype=np.uint8)
+        if is_current:
+            info['album_art_gray'] = (width, arr)
+        return arr
 
-        pixels = img.getdata()
-        chars = ["@", "#", "S", "%", "?", "*", "+", ";", ":", ",", "."]
-        new_pixels = [chars[int(pixel / 255 * (len(chars) - 1))] for pixel in pixels]
-        ascii_art = [''.join(new_pixels[i:i+width]) for i in range(0, len(new_pixels), width)]
-        return ascii_art
+    def get_ascii_art(self, img, width):
+        """Convert an image to ASCII art."""
+        # Map every pixel to a char index in one vectorized pass instead of a
+        # Python-level loop over getdata()
+        arr = self._gray_array(img, width)
+        idx = _quantize(arr, _ASCII_N)
+        return [''.join(row) for row in _ASCII_CHARS[idx]]
 
     def play_music_file(self, file_path):
-        """Play the selected music file using MPV."""
-        if self.player_process and self.player_process.poll() is None:
-            self.player_process.terminate()  # Stop any currently playing music
-
-        # Use MPV to play the file
-        self.player_process = subprocess.Popen(
-            ["mpv", "--no-video", "--quiet", str(file_path)],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
-        )
-
-        # Extract metadata
-        audio = MutagenFile(str(file_path))
-        track_length = audio.info.length if audio.info else None
-        tags = audio.tags
-
-        album_art_image = None  # Initialize album art image
-
-        if tags:
-            # Get track title and album name
-            track_title = tags.get('TIT2', tags.get('title', file_path.stem))
-            album_name = tags.get('TALB', tags.get('album', file_path.parent.name))
-
-            # Attempt to extract album art
-            album_art_data = None
-
-            if file_path.suffix.lower() in ['.mp3']:
-                # For MP3 files with ID3 tags
-                if 'APIC:' in tags:
-                    # Get the first APIC frame
-                    apic = tags.getall('APIC')[0]
-                    album_art_data = apic.data
-                elif any(isinstance(tag, APIC) for tag in tags.values()):
-                    # Alternate way to get APIC frames
-                    for tag in tags.values():
-                        if isinstance(tag, APIC):
-                            album_art_data = tag.data
-                            break
-
-            elif file_path.suffix.lower() in ['.m4a', '.mp4']:
-                # For MP4/M4A files
-                if 'covr' in tags:
-                    album_art_data = tags['covr'][0]
-            elif file_path.suffix.lower() in ['.flac']:
-                # For FLAC files
-                if 'METADATA_BLOCK_PICTURE' in tags:
-                    pic = tags['METADATA_BLOCK_PICTURE'][0]
-                    album_art_data = pic.data
-
-            # Process album art data if available
-            if album_art_data:
-                try:
-                    album_art_image = Image.open(io.BytesIO(album_art_data))
-                except Exception as e:
-                    logging.error(f"Error processing album art: {e}")
-                    album_art_image = None
-        else:
-            track_title = file_path.stem
-            album_name = file_path.parent.name
-            album_art_image = None
-
-        self.current_track_info = {
-            'title': str(track_title),
-            'album': str(album_name),
-            'length': track_length,
-            'album_art_image': album_art_image,
-            'file_path': file_path
-        }
+        """Play the selected music file on the shared MPV instance."""
+        self._ensure_mpv()
+        self._mpv_send(["loadfile", str(file_path), "replace"])
+        # mpv keeps the pause property across loadfile, so a track started
+        # after pausing would sit silent; force it back to playing
+        self._mpv_send(["set_property", "pause", False])
+
+        # Cached by the playlist prefetch in the common case; parses on miss
+        self.current_track_info = self._parse_metadata(file_path)
+        # Drop ASCII art rendered for the previous track's image
+        self._art_cache.clear()
+        self._track_changed = True
 
         self.playback_start_time = time.time()
         self.player_paused = False
@@ -411,18 +613,26 @@ class LocalMusicPlayer:
 
     def toggle_playback(self):
         """Toggle play/pause of the current track."""
+        if self.playback_start_time is None:
+            # The idle mpv is always alive, so process liveness alone no
+            # longer means a track is loaded (e.g. a stale [P] click after
+            # stop_music)
+            return
         if self.player_process and self.player_process.poll() is None:
+            # cycle pause over IPC; SIGSTOP froze the whole process including
+            # its IPC socket
+            if not self._mpv_send(["cycle", "pause"]):
+                return
             if self.player_paused:
-                self.player_process.send_signal(signal.SIGCONT)
                 self.playback_start_time += time.time() - self.pause_time  # Adjust playback time
                 self.player_paused = False
             else:
-                self.player_process.send_signal(signal.SIGSTOP)
                 self.pause_time = time.time()
                 self.player_paused = True
 
     def stop_music(self):
-        """Stop the currently playing music."""
+        """Stop the currently playing music; mpv stays idle for reuse."""
         if self.player_process and self.player_process.poll() is None:
-            self.player_process.terminate()
-            self.player_process = None
+            self._mpv_send(["stop"])
+        self.playback_start_time = None
+        self.player_paused = False
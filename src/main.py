@@ -21,44 +21,52 @@ class MediaDashboardApp:
             RadioPlayer(self.stdscr)
         ]
         self.window_titles = ["Local Music", "Local Media", "Spotify", "Radio"]
+        # Redraw only when marked dirty or when the periodic tick is due
+        # (keeps progress bars moving without repainting every loop pass).
+        self._dirty = True
+        self._last_progress_tick = 0.0
+        # Quadrant subwindows are created once and reused; rebuilt on resize
+        # or when returning from monocle mode (forced via _subwins = None).
+        self._subwins = None
+        self._last_size = None
         self.setup_curses()
 
     def setup_curses(self):
         curses.curs_set(0)  # Hide the cursor
-        self.stdscr.nodelay(1)
+        # getch blocks up to 100 ms and returns instantly on input; this is
+        # the loop's only pacing (no explicit sleep, no nodelay spinning)
         self.stdscr.timeout(100)
         curses.mousemask(curses.ALL_MOUSE_EVENTS | curses.REPORT_MOUSE_POSITION)
 
-    def draw_tiling(self):
-        self.stdscr.clear()
+    def _make_subwins(self):
+        """(Re)create the four quadrant subwindows and the static separators."""
         height, width = self.stdscr.getmaxyx()
         mid_y = height // 2
         mid_x = width // 2
 
-        # Define windows (quadrants), ensuring they fit within the screen dimensions
+        # Quadrant geometry: (height, width, row, col), fitting the screen
+        geometry = [
+            (mid_y, mid_x, 0, 0),
+            (mid_y, width - mid_x, 0, mid_x),
+            (height - mid_y, mid_x, mid_y, 0),
+            (height - mid_y, width - mid_x, mid_y, mid_x),
+        ]
+        self.stdscr.clear()
+        self._subwins = [self.stdscr.subwin(h, w, y, x) for h, w, y, x in geometry]
+
+        # Draw lines separating the windows; they only change with the layout
+        self.stdscr.vline(0, mid_x, curses.ACS_VLINE, height)
+        self.stdscr.hline(mid_y, 0, curses.ACS_HLINE, width)
+        self._last_size = (height, width)
+
+    def draw_tiling(self):
+        if self._subwins is None or self.stdscr.getmaxyx() != self._last_size:
+            self._make_subwins()
+
         for idx, module in enumerate(self.windows):
             if not module:
                 continue
-            # Calculate positions for quadrants
-            if idx == 0:
-                row, col = 0, 0
-                win_height = mid_y
-                win_width = mid_x
-            elif idx == 1:
-                row, col = 0, mid_x
-                win_height = mid_y
-                win_width = width - mid_x
-            elif idx == 2:
-                row, col = mid_y, 0
-                win_height = height - mid_y
-                win_width = mid_x
-            elif idx == 3:
-                row, col = mid_y, mid_x
-                win_height = height - mid_y
-                win_width = width - mid_x
-
-            # Sub-window for each quadrant
-            subwin = self.stdscr.subwin(win_height, win_width, row, col)
+            subwin = self._subwins[idx]
             subwin.box()
             subwin.addstr(1, 2, self.window_titles[idx] + ":")
 
@@ -68,14 +76,12 @@ class MediaDashboardApp:
 
             module.render(subwin)
 
-        # Draw lines separating the windows
-        self.stdscr.vline(0, mid_x, curses.ACS_VLINE, height)
-        self.stdscr.hline(mid_y, 0, curses.ACS_HLINE, width)
-
-        self.stdscr.refresh()
+        self.stdscr.noutrefresh()
+        curses.doupdate()
 
     def draw_monocle(self):
-        self.stdscr.clear()
+        # Do not clear here: module renderers repaint (or diff-paint) their own
+        # window, and a wholesale clear would blank rows they chose to keep.
         width = self.stdscr.getmaxyx()[1]  # Only get the width, as height is not needed
 
         # Draw the active window in monocle mode
@@ -91,10 +97,13 @@ class MediaDashboardApp:
         except Exception as e:
             self.stdscr.addstr(1, 1, f"Error loading {title}: {str(e)}")
             logging.error(f"Error rendering module {title}: {str(e)}")
-        self.stdscr.refresh()
+        # Stage stdscr and flush everything the modules queued in one burst
+        self.stdscr.noutrefresh()
+        curses.doupdate()
 
     def handle_mouse(self, event):
         """Handle mouse clicks and interactions."""
+        self._dirty = True
         if self.monocle_mode: #and self.active_window is not None:
             module = self.windows[self.active_window]
             if module and hasattr(module, 'handle_mouse'):
@@ -144,6 +153,8 @@ class MediaDashboardApp:
                 module.stop_media()
             if module and hasattr(module, 'stop_station'):
                 module.stop_station()
+            if module and hasattr(module, 'close'):
+                module.close()
 
     def handle_keypress(self, key):
         """Handle keypress actions globally and pass them to active modules."""
@@ -156,6 +167,7 @@ class MediaDashboardApp:
             # Check if the active window wants to exit monocle mode
             if hasattr(module, 'current_view') and module.current_view == "exit":
                 self.monocle_mode = False
+                self._subwins = None  # monocle content shares the buffer; rebuild
                 self.draw_tiling()
                 return True
 
@@ -169,6 +181,7 @@ class MediaDashboardApp:
                 return True
             elif key == ord('t'):  # Tiling mode
                 self.monocle_mode = False
+                self._subwins = None
                 self.draw_tiling()
             elif self.monocle_mode and key == ord('j'):
                 # Only change monocle window if module is in 'dashboard' view
@@ -186,26 +199,34 @@ class MediaDashboardApp:
         if key in (curses.KEY_BACKSPACE, ord('\b'), 127) and self.monocle_mode:
             if module.current_view == 'dashboard':
                 self.monocle_mode = False
+                self._subwins = None
                 self.draw_tiling()
 
     def main_loop(self):
         while True:
-            key = self.stdscr.getch()
-
-            if self.handle_keypress(key):
-                break
+            # Drain every queued keypress before rendering so a held key
+            # yields one redraw per frame instead of one per keypress
+            while True:
+                key = self.stdscr.getch()
+                if key == -1:
+                    break
+                if self.handle_keypress(key):
+                    return
+                self._dirty = True
 
             if self.monocle_mode and self.active_window is not None:
                 module = self.windows[self.active_window]
                 if module and hasattr(module, 'check_playback_status'):
                     module.check_playback_status()
 
-            if self.monocle_mode:
-                self.draw_monocle()
-            else:
-                self.draw_tiling()
-
-            time.sleep(0.1)  
+            now = time.time()
+            if self._dirty or now - self._last_progress_tick > 1.0:
+                if self.monocle_mode:
+                    self.draw_monocle()
+                else:
+                    self.draw_tiling()
+                self._dirty = False
+                self._last_progress_tick = now
 
 def main(stdscr):
     app = MediaDashboardApp(stdscr)
@@ -1,7 +1,12 @@
 # radio_player.py
 
 import curses
+import json
 import os
+import re
+import select
+import shutil
+import socket
 import subprocess
 import time
 import requests
@@ -9,6 +14,45 @@ import threading
 
 CHANNELS_FILE = os.path.expanduser("~/.local/share/media-dashboard/channels.json")
 
+# channels.json (de)serialization: orjson when installed (several times
+# faster than stdlib json), plain json otherwise. Both paths speak bytes so
+# the favorites file is always opened in binary mode.
+try:
+    import orjson
+    _fav_loads = orjson.loads
+    _fav_dumps = orjson.dumps
+except ImportError:
+    _fav_loads = json.loads
+    def _fav_dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+# Matches the "[NN%]" volume field in amixer output; compiled once and run
+# on the raw bytes so get_volume skips both regex setup and a full decode.
+_VOL_RE = re.compile(rb"\[(\d+)%\]")
+
+# In-process mixer writes via pyalsaaudio when available; the amixer
+# subprocess stays as the fallback.
+try:
+    import alsaaudio
+except ImportError:
+    alsaaudio = None
+
+# Radio Browser API access goes through one pooled session so repeated
+# searches reuse the TCP connection; results are cached for five minutes.
+_STATIONS_URL = "http://de1.api.radio-browser.info/json/stations/topclick/50"
+_STATIONS_TTL = 300  # seconds
+_SESSION = requests.Session()
+
+def _slim_station(station):
+    """Keep only the fields the UI renders and playback needs.
+
+    The API returns ~40 fields per station; dropping the rest shrinks the
+    in-memory lists and the favorites file by an order of magnitude.
+    """
+    return {'name': station.get('name', ''),
+            'url_resolved': station.get('url_resolved', ''),
+            'stationuuid': station.get('stationuuid')}
+
 class RadioPlayer:
     def __init__(self, stdscr):
         self.stdscr = stdscr
@@ -16,13 +60,68 @@ class RadioPlayer:
         self.current_view = "radio"  # views: radio, favorites, stations
         self.volume = self.get_volume()  # Get current system volume
         self.stations = []  # List of stations fetched from API
+        self._stations_fetched_at = 0.0  # when the station list was fetched
+        self._loading = False  # a station search is running on a worker thread
         self.favorites = self.load_favorites()
+        # O(1) membership for the add-to-favorites check; mirrors
+        # self.favorites keyed by the API's stationuuid
+        self._fav_ids = {s.get('stationuuid') for s in self.favorites}
         self.selected_index = 0  # For navigating lists
         self.current_station = None  # Currently playing station
         self.player_process = None  # mpv subprocess
-        self.update_thread = threading.Thread(target=self.update_volume)
-        self.update_thread.daemon = True
-        self.update_thread.start()
+        # One long-lived idle mpv instance; station changes become loadfile
+        # commands over its IPC socket instead of a fork per channel.
+        self._mpv_socket_path = f"/tmp/mpv_radio_socket_{os.getpid()}"
+        self._mpv_sock = None
+        # Damage tracking: facts about the previous frame so renders only
+        # rewrite cells that changed; a view/window/size change forces a
+        # full repaint. _list_version is bumped on any station/favorite
+        # mutation so list renders can tell content changes from pure
+        # selection moves.
+        self._prev = {"view": None, "window": None, "size": None,
+                      "station": None, "volume": None,
+                      "sel": None, "slice": None, "version": None, "rows": 0}
+        self._list_version = 0
+        # Set by state mutations in the key handlers; handle_keypress does
+        # at most one render per event when it is raised
+        self._dirty = False
+        # Precomputed chrome layout (title x, truncated instructions) per
+        # (view, size); full repaints reuse it instead of re-centering and
+        # re-slicing strings
+        self._chrome_cache = {}
+        # Truncated+padded list rows, rebuilt only when the list content or
+        # the row width changes rather than on every render
+        self._display_cache = {"view": None, "width": 0, "version": None, "rows": []}
+        # One reusable blank row for erasure, rebuilt only on width change
+        self._blank_row = ""
+        # Volume tracking is event-driven where possible: a `pactl subscribe`
+        # reader refreshes the cached value only when the mixer actually
+        # changes, instead of forking amixer every five seconds. Without
+        # pactl the value is re-read lazily from render_radio.
+        self._volume_read_at = time.time()
+        # Mixer handle for in-process volume writes; key-repeat bursts are
+        # debounced to one write per 50 ms with the latest value kept pending
+        self._mixer = None
+        if alsaaudio is not None:
+            try:
+                self._mixer = alsaaudio.Mixer('Master')
+            except alsaaudio.ALSAAudioError:
+                self._mixer = None
+        self._vol_write_at = 0.0
+        self._vol_pending = None
+        self._vol_timer = None
+        self._volume_proc = None
+        self.update_thread = None
+        # Self-pipe: one byte written by close() wakes the watcher thread
+        # instantly instead of leaving it blocked on pactl output
+        self._stop_r, self._stop_w = os.pipe()
+        if shutil.which("pactl"):
+            self._volume_proc = subprocess.Popen(
+                ["pactl", "subscribe"],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+            self.update_thread = threading.Thread(target=self.update_volume)
+            self.update_thread.daemon = True
+            self.update_thread.start()
 
     def render(self, window):
         self.window = window
@@ -33,110 +132,179 @@ class RadioPlayer:
         elif self.current_view == "stations":
             self.render_stations(window)
 
-    def render_radio(self, window):
-        window.clear()
-        window.box()
-        height, width = window.getmaxyx()
-        # Title
-        title = "RadioPlayer"
-        window.addstr(1, (width - len(title)) // 2, title, curses.A_BOLD)
-
-        # Display current station
-        if self.current_station:
-            station_str = f"Station: {self.current_station['name']}"
-            window.addstr(3, 2, station_str[:width - 4])
-        else:
-            window.addstr(3, 2, "No station selected.")
-
-        # Volume
-        volume_str = f"Volume: {self.volume}%"
-        window.addstr(4, 2, volume_str)
-
-        # Instructions
-        instructions = "[S] Search Stations  [F] Favorites  [+/-] Volume  [Backspace] Exit"
-        window.addstr(height - 2, 2, instructions[:width - 4])
-
-        window.refresh()
+    def _full_repaint_needed(self, view, window):
+        """Decide whether the static chrome must be redrawn from scratch."""
+        prev = self._prev
+        size = window.getmaxyx()
+        if (prev["view"] != view or prev["window"] is not window
+                or prev["size"] != size):
+            prev.update(view=view, window=window, size=size,
+                        station=None, volume=None,
+                        sel=None, slice=None, version=None, rows=0)
+            return True
+        return False
 
-    def render_stations(self, window):
+    def _paint_chrome(self, window, view, title, instructions):
+        """Draw the static chrome, caching its layout per (view, size)."""
+        height, width = window.getmaxyx()
+        key = (view, height, width)
+        chrome = self._chrome_cache.get(key)
+        if chrome is None:
+            chrome = ((width - len(title)) // 2, instructions[:width - 4])
+            self._chrome_cache[key] = chrome
+        title_x, instr = chrome
         window.clear()
         window.box()
-        height, width = window.getmaxyx()
-        title = "Available Stations"
-        window.addstr(1, (width - len(title)) // 2, title, curses.A_BOLD)
+        window.addstr(1, title_x, title, curses.A_BOLD)
+        window.addstr(height - 2, 2, instr)
 
-        if not self.stations:
-            window.addstr(3, 2, "No stations found. Press [S] to search.")
-        else:
-            start_y = 3
-            visible_items = height - start_y - 3
-            start_index = max(0, self.selected_index - visible_items // 2)
-            end_index = min(len(self.stations), start_index + visible_items)
+    def render_radio(self, window):
+        height, width = window.getmaxyx()
+        prev = self._prev
+        full = self._full_repaint_needed("radio", window)
+        if full:
+            self._paint_chrome(
+                window, "radio", "RadioPlayer",
+                "[S] Search Stations  [F] Favorites  [+/-] Volume  [Backspace] Exit")
+
+        # Station and volume lines are rewritten (padded, so no clear is
+        # needed) only when their value actually changed
+        station_name = self.current_station['name'] if self.current_station else None
+        if full or station_name != prev["station"]:
+            station_str = f"Station: {station_name}" if station_name else "No station selected."
+            window.addstr(3, 2, station_str[:width - 4].ljust(width - 4))
+            prev["station"] = station_name
+
+        # Without the pactl subscription, fall back to an on-demand re-read
+        # (rate-limited) so external volume changes still show up
+        if self.update_thread is None and time.time() - self._volume_read_at > 5:
+            self.volume = self.get_volume()
+            self._volume_read_at = time.time()
 
-            for idx in range(start_index, end_index):
-                station = self.stations[idx]
-                display_text = station['name'][:width - 4]
-                if idx == self.selected_index:
-                    window.addstr(start_y + idx - start_index, 2, display_text, curses.A_REVERSE)
-                else:
-                    window.addstr(start_y + idx - start_index, 2, display_text)
+        if full or self.volume != prev["volume"]:
+            window.addstr(4, 2, f"Volume: {self.volume}%"[:width - 4].ljust(width - 4))
+            prev["volume"] = self.volume
 
-        # Instructions
-        instructions = "[Enter] Play  [F] Add to Favorites  [Backspace] Back"
-        window.addstr(height - 2, 2, instructions[:width - 4])
+        window.noutrefresh()
 
-        window.refresh()
+    def _render_list(self, window, view, items, title, empty_msg, instructions, bottom_margin):
+        """Shared damage-tracked renderer for the stations/favorites lists.
 
-    def render_favorites(self, window):
-        window.clear()
-        window.box()
+        A selection move inside an unchanged visible slice repaints just the
+        old and new rows; anything else repaints the visible slice, blanking
+        rows left over from a longer previous list.
+        """
         height, width = window.getmaxyx()
-        title = "Favorite Stations"
-        window.addstr(1, (width - len(title)) // 2, title, curses.A_BOLD)
-
-        if not self.favorites:
-            window.addstr(3, 2, "No favorite stations.")
+        prev = self._prev
+        full = self._full_repaint_needed(view, window)
+        if full:
+            self._paint_chrome(window, view, title, instructions)
+
+        start_y = 3
+        row_w = width - 4
+        if len(self._blank_row) != row_w:
+            self._blank_row = " " * row_w
+
+        if not items:
+            if (full or prev["rows"] != 1 or prev["version"] != self._list_version
+                    or prev["slice"] != empty_msg):
+                window.addstr(start_y, 2, empty_msg[:row_w].ljust(row_w))
+                for y in range(start_y + 1, start_y + prev["rows"]):
+                    window.addstr(y, 2, self._blank_row)
+                # slice doubles as the last-painted placeholder text here
+                prev.update(slice=empty_msg, sel=None,
+                            version=self._list_version, rows=1)
+            window.noutrefresh()
+            return
+
+        visible_items = height - start_y - bottom_margin
+        start_index = max(0, self.selected_index - visible_items // 2)
+        end_index = min(len(items), start_index + visible_items)
+        display_rows = self._display_rows(view, items, row_w)
+
+        same_frame = (not full and prev["slice"] == (start_index, end_index)
+                      and prev["version"] == self._list_version)
+        if same_frame and prev["sel"] == self.selected_index:
+            pass  # nothing visible changed
+        elif same_frame:
+            # Selection moved within the same slice: the row text is already
+            # on screen, so flip attributes in place instead of rewriting it
+            for idx in (prev["sel"], self.selected_index):
+                if idx is not None and start_index <= idx < end_index:
+                    attr = curses.A_REVERSE if idx == self.selected_index else curses.A_NORMAL
+                    window.chgat(start_y + idx - start_index, 2, row_w, attr)
         else:
-            start_y = 3
-            visible_items = height - start_y - 2
-            start_index = max(0, self.selected_index - visible_items // 2)
-            end_index = min(len(self.favorites), start_index + visible_items)
-
+            rows = 0
             for idx in range(start_index, end_index):
-                station = self.favorites[idx]
-                display_text = station['name'][:width - 4]
-                if idx == self.selected_index:
-                    window.addstr(start_y + idx - start_index, 2, display_text, curses.A_REVERSE)
-                else:
-                    window.addstr(start_y + idx - start_index, 2, display_text)
+                attr = curses.A_REVERSE if idx == self.selected_index else curses.A_NORMAL
+                window.addstr(start_y + rows, 2, display_rows[idx], attr)
+                rows += 1
+            for y in range(start_y + rows, start_y + prev["rows"]):
+                window.addstr(y, 2, self._blank_row)
+            prev["rows"] = rows
+        prev.update(slice=(start_index, end_index), sel=self.selected_index,
+                    version=self._list_version)
+        window.noutrefresh()
+
+    def _display_rows(self, view, items, row_w):
+        """Return names truncated and padded to the row width, cached until
+        the list content or the width changes."""
+        cache = self._display_cache
+        if (cache["view"] != view or cache["width"] != row_w
+                or cache["version"] != self._list_version):
+            cache.update(view=view, width=row_w, version=self._list_version,
+                         rows=[s['name'][:row_w].ljust(row_w) for s in items])
+        return cache["rows"]
 
-        # Instructions
-        instructions = "[Enter] Play  [D] Delete  [Backspace] Back"
-        window.addstr(height - 2, 2, instructions[:width - 4])
+    def render_stations(self, window):
+        empty_msg = ("Loading stations..." if self._loading
+                     else "No stations found. Press [S] to search.")
+        self._render_list(
+            window, "stations", self.stations, "Available Stations",
+            empty_msg,
+            "[Enter] Play  [F] Add to Favorites  [Backspace] Back",
+            bottom_margin=3)
 
-        window.refresh()
+    def render_favorites(self, window):
+        self._render_list(
+            window, "favorites", self.favorites, "Favorite Stations",
+            "No favorite stations.",
+            "[Enter] Play  [D] Delete  [Backspace] Back",
+            bottom_margin=2)
 
     def handle_keypress(self, key):
         if self.current_view == "radio":
-            return self.handle_radio_keypress(key)
+            handled = self.handle_radio_keypress(key)
         elif self.current_view == "stations":
-            return self.handle_stations_keypress(key)
+            handled = self.handle_stations_keypress(key)
         elif self.current_view == "favorites":
-            return self.handle_favorites_keypress(key)
-        return False
+            handled = self.handle_favorites_keypress(key)
+        else:
+            return False
+        # State changes above only raised the dirty flag; paint at most one
+        # frame per event, then write the physical diff once
+        if self._dirty and self.window is not None:
+            self._dirty = False
+            self.render(self.window)
+        curses.doupdate()
+        return handled
 
     def handle_radio_keypress(self, key):
         handled = False
         if key == ord('s') or key == ord('S'):
-            self.search_stations()
+            # Switch views immediately and fetch on a worker thread so the
+            # UI is not frozen for the whole HTTP round-trip
             self.current_view = "stations"
             self.selected_index = 0
-            self.render(self.window)
+            if not self._loading:
+                self._loading = True
+                threading.Thread(target=self._do_search, daemon=True).start()
+            self._dirty = True
             handled = True
         elif key == ord('f') or key == ord('F'):
             self.current_view = "favorites"
             self.selected_index = 0
-            self.render(self.window)
+            self._dirty = True
             handled = True
         elif key == ord('+'):
             self.change_volume(5)
@@ -151,17 +319,37 @@ class RadioPlayer:
             handled = True
         return handled
 
+    _NAV_KEYS = (ord('j'), ord('k'), curses.KEY_DOWN, curses.KEY_UP)
+
+    def _coalesce_nav(self, key):
+        """Collapse a run of queued navigation keys into one net delta.
+
+        Holding j/k queues many events; draining them here turns N renders
+        into one. The first non-navigation key found is pushed back for the
+        normal dispatch path.
+        """
+        delta = 1 if key in (ord('j'), curses.KEY_DOWN) else -1
+        self.stdscr.nodelay(True)
+        try:
+            while True:
+                k = self.stdscr.getch()
+                if k == -1:
+                    break
+                if k not in self._NAV_KEYS:
+                    curses.ungetch(k)
+                    break
+                delta += 1 if k in (ord('j'), curses.KEY_DOWN) else -1
+        finally:
+            self.stdscr.timeout(100)
+        return delta
+
     def handle_stations_keypress(self, key):
         handled = False
-        if key == ord('j') or key == curses.KEY_DOWN:
-            if self.selected_index < len(self.stations) - 1:
-                self.selected_index += 1
-            self.render_stations(self.window)
-            handled = True
-        elif key == ord('k') or key == curses.KEY_UP:
-            if self.selected_index > 0:
-                self.selected_index -= 1
-            self.render_stations(self.window)
+        if key in self._NAV_KEYS:
+            delta = self._coalesce_nav(key)
+            self.selected_index = max(0, min(len(self.stations) - 1,
+                                             self.selected_index + delta))
+            self._dirty = True
             handled = True
         elif key == ord('\n'):
             # Play selected station
@@ -169,39 +357,39 @@ class RadioPlayer:
             self.current_station = station
             self.play_station(station['url_resolved'])
             self.current_view = "radio"
-            self.render(self.window)
+            self._dirty = True
             handled = True
         elif key == ord('f') or key == ord('F'):
             # Add to favorites
             station = self.stations[self.selected_index]
-            if station not in self.favorites:
+            if station.get('stationuuid') not in self._fav_ids:
                 self.favorites.append(station)
+                self._fav_ids.add(station.get('stationuuid'))
+                self._list_version += 1
                 self.save_favorites()
                 # Display confirmation message briefly
                 height, width = self.window.getmaxyx()
                 confirmation_message = f"Added {station['name']} to favorites."
                 self.window.addstr(height - 2, 2, confirmation_message[:width - 4])
-                self.window.refresh()
+                self.window.noutrefresh()
+                curses.doupdate()  # show the message now; napms blocks next
                 curses.napms(1500)  # Pause for 1.5 seconds
-                self.render_stations(self.window)  # Re-render stations to clear message
+                self._prev["view"] = None  # message clobbered the chrome; full repaint
+                self._dirty = True  # repaint happens once the handler returns
             handled = True
         elif key in (curses.KEY_BACKSPACE, ord('\b'), 127):
             self.current_view = "radio"
-            self.render(self.window)
+            self._dirty = True
             handled = True
         return handled
 
     def handle_favorites_keypress(self, key):
         handled = False
-        if key == ord('j') or key == curses.KEY_DOWN:
-            if self.selected_index < len(self.favorites) - 1:
-                self.selected_index += 1
-            self.render_favorites(self.window)
-            handled = True
-        elif key == ord('k') or key == curses.KEY_UP:
-            if self.selected_index > 0:
-                self.selected_index -= 1
-            self.render_favorites(self.window)
+        if key in self._NAV_KEYS:
+            delta = self._coalesce_nav(key)
+            self.selected_index = max(0, min(len(self.favorites) - 1,
+                                             self.selected_index + delta))
+            self._dirty = True
             handled = True
         elif key == ord('\n'):
             # Play selected favorite station
@@ -209,82 +397,211 @@ class RadioPlayer:
             self.current_station = station
             self.play_station(station['url_resolved'])
             self.current_view = "radio"
-            self.render(self.window)
+            self._dirty = True
             handled = True
         elif key == ord('d') or key == ord('D'):
             # Delete favorite
-            del self.favorites[self.selected_index]
+            removed = self.favorites.pop(self.selected_index)
+            self._fav_ids.discard(removed.get('stationuuid'))
+            self._list_version += 1
             self.save_favorites()
             if self.selected_index >= len(self.favorites) and self.selected_index > 0:
                 self.selected_index -= 1
-            self.render_favorites(self.window)
+            self._dirty = True
             handled = True
         elif key in (curses.KEY_BACKSPACE, ord('\b'), 127):
             self.current_view = "radio"
-            self.render(self.window)
+            self._dirty = True
             handled = True
         return handled
 
+    def _do_search(self):
+        """Run search_stations off the UI thread, then wake the input loop."""
+        try:
+            self.search_stations()
+        finally:
+            self._loading = False
+            try:
+                # Injected key wakes the blocking getch so the results paint
+                # without waiting for the next periodic tick
+                curses.ungetch(curses.KEY_RESIZE)
+            except curses.error:
+                pass
+
     def search_stations(self):
+        # Serve repeated searches from the short-lived cache instead of
+        # re-fetching the same top-50 list on every press of S
+        if self.stations and time.time() - self._stations_fetched_at < _STATIONS_TTL:
+            return
         # Fetch top 50 stations from Radio Browser API
         try:
-            response = requests.get("http://de1.api.radio-browser.info/json/stations/topclick/50")
+            response = _SESSION.get(_STATIONS_URL, timeout=5)
             if response.status_code == 200:
-                self.stations = response.json()
+                self.stations = [_slim_station(s) for s in response.json()]
             else:
                 self.stations = []
         except Exception as e:
             print(f"Error fetching stations: {e}")
             self.stations = []
+        self._stations_fetched_at = time.time()
+        self._list_version += 1
+
+    def _ensure_mpv(self):
+        """Spawn the shared idle mpv instance if it is not already running."""
+        if self.player_process and self.player_process.poll() is None:
+            return
+        self._close_mpv_socket()
+        self.player_process = subprocess.Popen(
+            ["mpv", "--no-video", "--quiet", "--idle=yes",
+             f"--input-ipc-server={self._mpv_socket_path}"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
+    def _connect_mpv(self, retries=50, delay=0.1):
+        """Connect to the mpv IPC socket, waiting for mpv to create it."""
+        for _ in range(retries):
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(self._mpv_socket_path)
+                self._mpv_sock = sock
+                return sock
+            except (FileNotFoundError, ConnectionRefusedError):
+                sock.close()
+                time.sleep(delay)
+        return None
+
+    def _close_mpv_socket(self):
+        if self._mpv_sock is not None:
+            try:
+                self._mpv_sock.close()
+            except OSError:
+                pass
+            self._mpv_sock = None
+
+    def _mpv_send(self, command):
+        """Send one JSON IPC command to the shared mpv instance."""
+        payload = (json.dumps({"command": command}) + "\n").encode("utf-8")
+        for _ in range(2):  # one retry after reconnecting on a dead socket
+            sock = self._mpv_sock or self._connect_mpv()
+            if sock is None:
+                return False
+            try:
+                sock.sendall(payload)
+                return True
+            except OSError:
+                self._close_mpv_socket()
+        return False
 
     def play_station(self, stream_url):
-        self.stop_station()
-        # Start mpv to play the stream
-        self.player_process = subprocess.Popen(['mpv', '--no-video', stream_url], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        """Swap the stream on the shared mpv instance; no respawn per station."""
+        self._ensure_mpv()
+        self._mpv_send(["loadfile", stream_url])
 
     def stop_station(self):
-        if self.player_process:
-            self.player_process.terminate()
-            self.player_process = None
+        if self.player_process and self.player_process.poll() is None:
+            self._mpv_send(["stop"])  # mpv stays idle for the next station
+
+    def stop_media(self):
+        """Tear down the shared mpv instance on shutdown."""
+        if self.player_process and self.player_process.poll() is None:
+            if not self._mpv_send(["quit"]):
+                self.player_process.terminate()
+            self.player_process.wait()
+        self.player_process = None
+        self._close_mpv_socket()
+        if os.path.exists(self._mpv_socket_path):
+            os.remove(self._mpv_socket_path)
 
     def change_volume(self, delta):
         self.volume = max(0, min(100, self.volume + delta))
-        # Use amixer to change volume
-        subprocess.call(["amixer", "set", "Master", f"{self.volume}%"])
-        self.render(self.window)
+        # Coalesce key-repeat storms: at most one mixer write per 50 ms; a
+        # short timer flushes the last parked value so it survives even if
+        # the radio view is never repainted again
+        if time.monotonic() - self._vol_write_at < 0.05:
+            self._vol_pending = self.volume
+            if self._vol_timer is not None:
+                self._vol_timer.cancel()
+            self._vol_timer = threading.Timer(0.05, self._flush_volume)
+            self._vol_timer.daemon = True
+            self._vol_timer.start()
+        else:
+            self._write_volume(self.volume)
+        self._dirty = True
+
+    def _flush_volume(self):
+        """Write a parked debounced volume once its window has passed."""
+        if self._vol_pending is not None:
+            self._write_volume(self._vol_pending)
+
+    def _write_volume(self, volume):
+        self._vol_write_at = time.monotonic()
+        self._vol_pending = None
+        if self._mixer is not None:
+            self._mixer.setvolume(volume)  # direct ALSA call, no fork
+        else:
+            subprocess.call(["amixer", "set", "Master", f"{volume}%"])
 
     def get_volume(self):
         # Get current system volume using amixer
         try:
-            output = subprocess.check_output(["amixer", "get", "Master"]).decode()
-            # Parse the output to find the volume percentage
-            import re
-            matches = re.findall(r"\[(\d+)%\]", output)
-            if matches:
-                return int(matches[0])
+            output = subprocess.check_output(["amixer", "get", "Master"])
+            match = _VOL_RE.search(output)
+            if match:
+                return int(match.group(1))
         except Exception as e:
             print(f"Error getting volume: {e}")
         return 50  # Default value if unable to get volume
 
     def update_volume(self):
+        """Re-read the mixer only when PulseAudio reports a sink event."""
+        stdout = self._volume_proc.stdout
         while True:
-            self.volume = self.get_volume()
-            time.sleep(5)  # Update every 5 seconds
+            ready, _, _ = select.select([stdout, self._stop_r], [], [], 5)
+            if self._stop_r in ready:
+                return
+            if stdout in ready:
+                line = stdout.readline()
+                if not line:  # pactl exited
+                    return
+                if "sink" in line:
+                    self.volume = self.get_volume()
+                    self._volume_read_at = time.time()
+
+    def close(self):
+        """Stop the volume watcher thread and its pactl subprocess."""
+        if self._vol_timer is not None:
+            self._vol_timer.cancel()
+        if self._stop_w is not None:
+            os.write(self._stop_w, b"x")
+        if self.update_thread is not None:
+            self.update_thread.join(timeout=1)
+            self.update_thread = None
+        if self._volume_proc is not None:
+            self._volume_proc.terminate()
+            self._volume_proc = None
+        if self._stop_w is not None:
+            os.close(self._stop_r)
+            os.close(self._stop_w)
+            self._stop_r = self._stop_w = None
 
     def load_favorites(self):
         if not os.path.exists(os.path.dirname(CHANNELS_FILE)):
             os.makedirs(os.path.dirname(CHANNELS_FILE))
         if os.path.isfile(CHANNELS_FILE):
-            import json
-            with open(CHANNELS_FILE, "r") as f:
-                return json.load(f)
+            with open(CHANNELS_FILE, "rb") as f:
+                return _fav_loads(f.read())
         else:
             return []
 
     def save_favorites(self):
-        with open(CHANNELS_FILE, "w") as f:
-            import json
-            json.dump(self.favorites, f)
+        # Write-then-rename so a crash mid-save cannot truncate the file
+        tmp_path = CHANNELS_FILE + ".tmp"
+        with open(tmp_path, "wb") as f:
+            # Re-slim on save so favorites from older, full-fat files shrink
+            # the first time they are rewritten
+            f.write(_fav_dumps([_slim_station(s) for s in self.favorites]))
+        os.replace(tmp_path, CHANNELS_FILE)
 
     def handle_mouse(self, event):
         pass  # Implement mouse handling if desired
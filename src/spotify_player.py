@@ -1,14 +1,21 @@
 import curses
+import hashlib
+import json
 import os
 import time
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from spotipy.oauth2 import SpotifyOAuth
 import spotipy
 from dotenv import load_dotenv
 import threading
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import io
 from PIL import Image
+import numpy as np
 
 logging.basicConfig(
     filename="spotify_player_debug.log",
@@ -16,10 +23,101 @@ logging.basicConfig(
     format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
+# Pixel-to-character mapping constant-folded at import: all 256 gray levels
+# resolve to their character up front, so converting a frame is one fancy
+# index with no per-pixel arithmetic.
+_ASCII_CHARS = np.array(list("@#S%?*+;:,."), dtype='U1')
+_PIX_LUT = _ASCII_CHARS[(np.arange(256, dtype=np.uint16) * (len(_ASCII_CHARS) - 1)) // 255]
+
+# Persistent cache for paginated Web-API results (playlists, albums, track
+# lists). Entries are JSON files keyed by a hash of a logical key; playlist
+# tracks embed Spotify's own snapshot_id in the key so they invalidate only
+# when Spotify says the playlist changed.
+_API_CACHE_DIR = Path.home() / ".cache" / "media-tui" / "spotify"
+_API_CACHE_MAX_FILES = 256
+_API_MEM_CACHE_SIZE = 32
+
+def _api_cache_file(key):
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return _API_CACHE_DIR / f"{digest}.json"
+
+def _prune_api_cache():
+    """Drop the oldest cache entries once the directory grows past its cap.
+
+    Needed because playlist-track keys embed the snapshot_id: every edit to
+    a playlist strands the previous snapshot's file, which nothing would
+    ever read again.
+    """
+    try:
+        with os.scandir(_API_CACHE_DIR) as it:
+            entries = [e for e in it if e.name.endswith('.json')]
+        if len(entries) <= _API_CACHE_MAX_FILES:
+            return
+        entries.sort(key=lambda e: e.stat().st_mtime_ns)
+        for entry in entries[:len(entries) - _API_CACHE_MAX_FILES]:
+            os.remove(entry.path)
+    except OSError:
+        pass
+
+def _api_cache_get(key, max_age):
+    """Return the cached payload for key, or None if absent or stale."""
+    try:
+        with open(_api_cache_file(key), "r") as f:
+            entry = json.load(f)
+        if time.time() - entry["ts"] <= max_age:
+            return entry["data"]
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+def _api_cache_put(key, data):
+    try:
+        _API_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_api_cache_file(key), "w") as f:
+            json.dump({"ts": time.time(), "data": data}, f)
+        _prune_api_cache()
+    except OSError as e:
+        logging.error(f"Could not write API cache entry: {e}")
+
+def _format_time(seconds):
+    mins = int(seconds) // 60
+    secs = int(seconds) % 60
+    return f"{mins}:{secs:02d}"
+
+class _LockedSpotify:
+    """Serialize spotipy calls shared between the UI and poller threads.
+
+    spotipy's client is not documented as thread-safe, so every method call
+    on the shared instance runs under one re-entrant lock. Non-callable
+    attributes (auth_manager and friends) pass straight through.
+    """
+
+    def __init__(self, client, lock):
+        self._client = client
+        self._lock = lock
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+        lock = self._lock
+
+        def locked(*args, **kwargs):
+            with lock:
+                return attr(*args, **kwargs)
+        return locked
+
 class SpotifyPlayer:
     def __init__(self, stdscr):
         self.stdscr = stdscr
+        self._sp_lock = threading.RLock()
         self.sp = self.authenticate()
+        if self.sp is not None:
+            self.sp = _LockedSpotify(self.sp, self._sp_lock)
+        # Per-thread clients for the pagination workers: they share the one
+        # auth_manager (and its token cache) but issue requests without
+        # queueing on the shared lock.
+        self._sp_local = threading.local()
         self.current_view = "explorer"  # views: explorer, tracks, player, devices
         self.explorer_mode = "playlists"  # modes: playlists, albums
         self.window = None
@@ -38,6 +136,67 @@ class SpotifyPlayer:
         self.volume = 50  # Default volume at 50%
         self.devices = []
         self.current_device = None
+        # Two cache layers for paginated API results: a small in-memory LRU
+        # for instant re-entry into a view, backed by the JSON files under
+        # _API_CACHE_DIR for cross-run reuse.
+        self._api_mem = OrderedDict()
+        self._user_id = None
+        # Workers for pagination: the first page reports the total, so the
+        # remaining offsets are fetched in parallel instead of chained
+        # sp.next round-trips.
+        self._api_executor = ThreadPoolExecutor(max_workers=8)
+        # Pooled HTTP session for album-art downloads: keeps the CDN
+        # connection alive across tracks instead of a TLS handshake per
+        # download, with a small retry budget. Decoded images are LRU-cached
+        # by URL so returning to a recent track skips the download entirely.
+        self.http = requests.Session()
+        _adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16,
+                               max_retries=Retry(total=2, backoff_factor=0.3))
+        self.http.mount("https://", _adapter)
+        self.http.mount("http://", _adapter)
+        self._art_image_cache = OrderedDict()
+        # Album art is downloaded and converted off the render path: misses
+        # schedule a fetch on this small pool and the player paints a
+        # placeholder until the cache is warm.
+        self._art_executor = ThreadPoolExecutor(max_workers=2)
+        self._art_pending = set()
+        # Rendered ASCII art keyed by (url, width): play/pause toggles and
+        # progress ticks reuse the finished lines outright
+        self._ascii_cache = OrderedDict()
+        # Damage tracking: each view renders as a list of (text, attr)
+        # interior lines diffed against the previous frame, so unchanged
+        # rows are never retransmitted. A view/window/size change forces a
+        # full clear+repaint.
+        self._prev_view = None
+        self._prev_window = None
+        self._prev_size = None
+        self._prev_lines = []
+        # Display strings derived once per list change, not per frame
+        self._display_cache = {}
+        # Player controls row and its clickable regions, keyed by window
+        # size and whether volume controls apply
+        self._buttons_cache_key = None
+        self._buttons_cache = None
+        # Formatted track length (per track) and progress-bar runs (per
+        # width); the per-frame bar is just two slices
+        # Pending debounced volume write
+        self._vol_timer = None
+        self._total_str_key = None
+        self._total_str = ""
+        self._pb_width = None
+        self._pb_fill = ""
+        self._pb_space = ""
+        # Playback poller pacing: an Event instead of a bare sleep so view
+        # changes can interrupt the wait, plus the last observed playback
+        # state so polls that saw nothing new skip the render entirely.
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._last_pb_state = None
+        self._token_checked_at = 0.0
+        # Last progress report from the poller; the render path extrapolates
+        # from this instead of asking the Web API for the position.
+        self._last_progress_ms = 0
+        self._last_progress_ts = None
         self.update_playback_thread = threading.Thread(target=self.update_playback_info)
         self.update_playback_thread.daemon = True
         self.update_playback_thread.start()
@@ -65,59 +224,119 @@ class SpotifyPlayer:
             logging.error(f"Error during Spotify OAuth: {e}")
             return None
 
+    def _get_user_id(self):
+        """Fetch the current user id once and keep it for cache keys."""
+        if self._user_id is None:
+            self._user_id = self.sp.current_user()['id']
+        return self._user_id
+
+    def _cached_fetch(self, key, max_age, fetch):
+        """Memoize a paginated fetch in memory and on disk.
+
+        Hits skip the whole Web-API walk; the memory layer is a small LRU so
+        re-entering a view costs a dict lookup.
+        """
+        if key in self._api_mem:
+            self._api_mem.move_to_end(key)
+            return self._api_mem[key]
+        data = _api_cache_get(key, max_age)
+        if data is None:
+            data = fetch()
+            _api_cache_put(key, data)
+        self._api_mem[key] = data
+        if len(self._api_mem) > _API_MEM_CACHE_SIZE:
+            self._api_mem.popitem(last=False)
+        return data
+
     def get_user_playlists(self):
         """Fetch the user's playlists (only those created by the user)."""
-        playlists = []
-        user_id = self.sp.current_user()['id']
-        results = self.sp.current_user_playlists()
-        while results:
-            for item in results['items']:
-                if item['owner']['id'] == user_id:
-                    playlists.append(item)
-            if results['next']:
-                results = self.sp.next(results)
-            else:
-                results = None
-        self.playlists = playlists
+        # Short TTL: the listing itself must notice new snapshot_ids
+        user_id = self._get_user_id()
+        self.playlists = self._cached_fetch(
+            f"playlists:{user_id}", 300, self._fetch_user_playlists)
+
+    def _thread_sp(self):
+        """Return this thread's own spotipy client for parallel page fetches."""
+        sp = getattr(self._sp_local, 'client', None)
+        if sp is None:
+            sp = spotipy.Spotify(auth_manager=self.sp.auth_manager)
+            self._sp_local.client = sp
+        return sp
+
+    def _fetch_pages(self, fetch_page, first):
+        """Gather every item of a paginated endpoint, fetching in parallel.
+
+        first is the already-fetched first page; its total and limit tell us
+        every remaining offset up front, so the pages are requested
+        concurrently and stitched back together in offset order.
+        """
+        items = list(first['items'])
+        limit = first['limit'] or len(items) or 1
+        offsets = range(limit, first['total'], limit)
+        futures = [self._api_executor.submit(fetch_page, off) for off in offsets]
+        for future in futures:
+            items.extend(future.result()['items'])
+        return items
+
+    def _fetch_user_playlists(self):
+        user_id = self._get_user_id()
+        first = self.sp.current_user_playlists(limit=50)
+        items = self._fetch_pages(
+            lambda off: self._thread_sp().current_user_playlists(limit=50, offset=off),
+            first)
+        return [item for item in items if item['owner']['id'] == user_id]
 
     def get_user_albums(self):
         """Fetch the user's saved albums (liked albums)."""
-        albums = []
-        results = self.sp.current_user_saved_albums()
-        while results:
-            albums.extend([item['album'] for item in results['items']])
-            if results['next']:
-                results = self.sp.next(results)
-            else:
-                results = None
-        self.albums = albums
+        self.albums = self._cached_fetch(
+            f"albums:{self._get_user_id()}", 300, self._fetch_user_albums)
+
+    def _fetch_user_albums(self):
+        first = self.sp.current_user_saved_albums(limit=50)
+        items = self._fetch_pages(
+            lambda off: self._thread_sp().current_user_saved_albums(limit=50, offset=off),
+            first)
+        return [item['album'] for item in items]
 
     def get_playlist_tracks(self, playlist_id):
         """Fetch tracks from a playlist."""
-        tracks = []
-        results = self.sp.playlist_tracks(playlist_id)
-        while results:
-            tracks.extend(results['items'])
-            if results['next']:
-                results = self.sp.next(results)
-            else:
-                results = None
-        self.tracks = tracks
+        # snapshot_id in the key means the cache invalidates exactly when
+        # Spotify reports the playlist changed
+        snapshot = (self.current_playlist or {}).get('snapshot_id', '')
+        self.tracks = self._cached_fetch(
+            f"playlist-tracks:{playlist_id}:{snapshot}", 86400,
+            lambda: self._fetch_playlist_tracks(playlist_id))
+
+    def _fetch_playlist_tracks(self, playlist_id):
+        first = self.sp.playlist_tracks(playlist_id, limit=100)
+        return self._fetch_pages(
+            lambda off: self._thread_sp().playlist_tracks(playlist_id, limit=100, offset=off),
+            first)
 
     def get_album_tracks(self, album_id):
         """Fetch tracks from an album."""
-        tracks = []
-        results = self.sp.album_tracks(album_id)
-        while results:
-            tracks.extend(results['items'])
-            if results['next']:
-                results = self.sp.next(results)
-            else:
-                results = None
-        self.tracks = tracks
+        # Album track lists are immutable, so the id alone is a safe key
+        self.tracks = self._cached_fetch(
+            f"album-tracks:{album_id}", 86400,
+            lambda: self._fetch_album_tracks(album_id))
+
+    def _fetch_album_tracks(self, album_id):
+        first = self.sp.album_tracks(album_id, limit=50)
+        return self._fetch_pages(
+            lambda off: self._thread_sp().album_tracks(album_id, limit=50, offset=off),
+            first)
 
     def render(self, window):
         """Render different views based on the current state."""
+        if window is not self.window:
+            # New drawing surface: keep the hardware cursor hidden and let
+            # curses leave it wherever the last write ended instead of
+            # repositioning it after every frame
+            try:
+                window.leaveok(True)
+                curses.curs_set(0)
+            except curses.error:
+                pass
         self.window = window
         if self.current_view == "explorer":
             self.render_explorer(window)
@@ -128,82 +347,145 @@ class SpotifyPlayer:
         elif self.current_view == "devices":
             self.render_devices(window)
 
+    def _paint_frame(self, window, view, lines):
+        """Diff-paint interior lines (row 1 downward) against the last frame.
+
+        Only rows whose (text, attr) changed are rewritten; rows the previous
+        frame used beyond this one are blanked. A view, window, or size
+        change clears and repaints everything, including the box.
+        """
+        height, width = window.getmaxyx()
+        full = (view != self._prev_view or window is not self._prev_window
+                or (height, width) != self._prev_size)
+        if full:
+            window.clear()
+            window.box()
+            self._prev_lines = []
+        row_w = max(0, width - 4)
+        max_rows = height - 2
+        prev_lines = self._prev_lines
+        for row, line in enumerate(lines):
+            if row >= max_rows:
+                break
+            if not full and row < len(prev_lines) and prev_lines[row] == line:
+                continue
+            text, attr = line
+            window.addnstr(row + 1, 2, text.ljust(row_w), row_w, attr)
+        if not full:
+            for row in range(len(lines), min(len(prev_lines), max_rows)):
+                window.addnstr(row + 1, 2, " " * row_w, row_w)
+        self._prev_view = view
+        self._prev_window = window
+        self._prev_size = (height, width)
+        self._prev_lines = lines
+        # Stage only; the keypress/poller paths flush with one doupdate
+        window.noutrefresh()
+
+    def _flash_message(self, *msgs, delay=1):
+        """Show a transient message immediately; the next render repaints."""
+        try:
+            for i, msg in enumerate(msgs):
+                self.window.addstr(2 + i, 2, msg)
+            # Flush immediately: the message must be visible for the sleep
+            self.window.noutrefresh()
+            curses.doupdate()
+        except curses.error:
+            pass
+        time.sleep(delay)
+        self._prev_view = None  # the message dirtied rows behind our back
+
+    def _display_strings(self, kind, seq, build):
+        """Return cached display strings for seq, rebuilding when it changes.
+
+        The playlist/album/track/device lists are replaced wholesale when
+        (re)fetched, so object identity is a sufficient change signal.
+        """
+        cached = self._display_cache.get(kind)
+        if cached is not None and cached[0] is seq:
+            return cached[1]
+        rows = [build(entry) for entry in seq]
+        self._display_cache[kind] = (seq, rows)
+        return rows
+
     def render_explorer(self, window):
         """Render the explorer view showing playlists or albums based on mode."""
-        window.clear()
-        window.box()
         if self.explorer_mode == 'playlists':
             header = "Your Playlists (Press 'A' for Albums):"
             if not self.playlists:
                 self.get_user_playlists()
             self.items = self.playlists
+            rows = self._display_strings(
+                'playlists', self.items, lambda item: item['name'])
         elif self.explorer_mode == 'albums':
             header = "Your Liked Albums (Press 'P' for Playlists):"
             if not self.albums:
                 self.get_user_albums()
             self.items = self.albums
-        window.addstr(1, 2, header)
+            rows = self._display_strings(
+                'albums', self.items,
+                lambda item: f"{item['name']} - {item['artists'][0]['name']}")
         max_y, max_x = window.getmaxyx()
         start_y = 3
         visible_items = max_y - start_y - 2  # Account for window borders and title
         start_index = max(0, self.selected_index - (visible_items // 2))
         end_index = min(len(self.items), start_index + visible_items)
+        lines = [(header, 0), ("", 0)]
         for idx in range(start_index, end_index):
-            item = self.items[idx]
-            if self.explorer_mode == 'playlists':
-                display_text = f"{item['name']}"
-            elif self.explorer_mode == 'albums':
-                display_text = f"{item['name']} - {item['artists'][0]['name']}"
-            truncated_text = display_text[:max_x - 4]
-            if idx == self.selected_index:
-                window.addstr(start_y + (idx - start_index), 2, truncated_text, curses.A_REVERSE)
-            else:
-                window.addstr(start_y + (idx - start_index), 2, truncated_text)
+            attr = curses.A_REVERSE if idx == self.selected_index else 0
+            lines.append((rows[idx][:max_x - 4], attr))
         if self.current_track:
-            prompt = "Press [C] to view the currently playing song"
-            window.addstr(max_y - 2, 2, prompt[:max_x - 4])  # Truncate if necessary
-        window.refresh()
+            # Pin the prompt to the bottom interior row
+            while len(lines) < max_y - 3:
+                lines.append(("", 0))
+            lines.append(("Press [C] to view the currently playing song", 0))
+        self._paint_frame(window, "explorer", lines)
 
     def render_tracks(self, window):
         """Render the tracks view showing tracks in a playlist or album."""
-        window.clear()
-        window.box()
         if self.explorer_mode == 'playlists':
             header = f"Playlist: {self.current_playlist['name']}"
+            rows = self._display_strings(
+                'tracks', self.tracks,
+                lambda entry: f"{entry['track']['name']} - "
+                              f"{', '.join(a['name'] for a in entry['track']['artists'])}")
         elif self.explorer_mode == 'albums':
             header = f"Album: {self.current_album['name']}"
-        window.addstr(1, 2, header)
+            rows = self._display_strings(
+                'tracks', self.tracks,
+                lambda track: f"{track['name']} - "
+                              f"{', '.join(a['name'] for a in track['artists'])}")
         max_y, max_x = window.getmaxyx()
         start_y = 3
         visible_items = max_y - start_y - 2
         start_index = max(0, self.selected_index - (visible_items // 2))
         end_index = min(len(self.tracks), start_index + visible_items)
+        lines = [(header, 0), ("", 0)]
         for idx in range(start_index, end_index):
-            if self.explorer_mode == 'playlists':
-                track = self.tracks[idx]['track']
-            elif self.explorer_mode == 'albums':
-                track = self.tracks[idx]
-            display_text = f"{track['name']} - {', '.join(artist['name'] for artist in track['artists'])}"
-            truncated_text = display_text[:max_x - 4]
-            if idx == self.selected_index:
-                window.addstr(start_y + (idx - start_index), 2, truncated_text, curses.A_REVERSE)
-            else:
-                window.addstr(start_y + (idx - start_index), 2, truncated_text)
+            attr = curses.A_REVERSE if idx == self.selected_index else 0
+            lines.append((rows[idx][:max_x - 4], attr))
         if self.current_track:
-            prompt = "Press [C] to view the currently playing song"
-            window.addstr(max_y - 2, 2, prompt[:max_x - 4])  # Truncate if necessary
-        window.refresh()
+            while len(lines) < max_y - 3:
+                lines.append(("", 0))
+            lines.append(("Press [C] to view the currently playing song", 0))
+        self._paint_frame(window, "tracks", lines)
 
     def render_player(self, window):
         """Render the player view with track info and controls."""
-        window.clear()
-        window.box()
         height, width = window.getmaxyx()
+        lines = []
+
+        def put(y, text, attr=0):
+            """Place text on absolute row y, padding the lines list as needed."""
+            row = y - 1
+            while len(lines) <= row:
+                lines.append(("", 0))
+            lines[row] = (text, attr)
+
         # Get track info
         track = self.current_track
         if not track:
-            window.addstr(2, 2, "No track is currently playing.")
-            window.refresh()
+            put(2, "No track is currently playing.")
+            self._paint_frame(window, "player", lines)
             return
         track_name = track['name']
         artist_names = ', '.join(artist['name'] for artist in track['artists'])
@@ -216,107 +498,111 @@ class SpotifyPlayer:
         if self.current_device and not self.current_device.get('volume_percent'):
             volume_control_allowed = False
 
-        # Download album art
-        album_art_image = None
-        if album_art_url:
-            album_art_image = self.get_album_art_image(album_art_url)
-        # Format times
-        def format_time(seconds):
-            mins = int(seconds) // 60
-            secs = int(seconds) % 60
-            return f"{mins}:{secs:02d}"
-        # Get playback position
-        playback_info = self.sp.current_playback()
-        elapsed_time = playback_info['progress_ms'] / 1000 if playback_info and playback_info['progress_ms'] else 0
-        elapsed_str = format_time(elapsed_time)
-        total_str = format_time(track_length)
-        # Progress Bar
-        progress_bar_length = width - 4
+        # Derive the position from the poller's last report instead of a
+        # synchronous Web-API round-trip on the render path
+        elapsed_time = self._last_progress_ms / 1000
+        if self._last_progress_ts is not None and not self.player_paused:
+            elapsed_time += time.monotonic() - self._last_progress_ts
+        elapsed_time = min(elapsed_time, track_length)
+        elapsed_str = _format_time(elapsed_time)
+        if self._total_str_key != track['id']:
+            self._total_str_key = track['id']
+            self._total_str = _format_time(track_length)
+        total_str = self._total_str
+        # Progress Bar: slice the prebuilt runs instead of multiplying
+        # fresh strings every frame. The brackets plus runs must fit the
+        # width - 4 interior _paint_frame paints, or the ']' gets clipped.
+        progress_bar_length = width - 6
+        if self._pb_width != progress_bar_length:
+            self._pb_width = progress_bar_length
+            self._pb_fill = '#' * progress_bar_length
+            self._pb_space = ' ' * progress_bar_length
         progress = elapsed_time / track_length if track_length else 0
         filled_length = int(progress_bar_length * progress)
-        progress_bar = '[' + '#' * filled_length + ' ' * (progress_bar_length - filled_length) + ']'
+        progress_bar = ('[' + self._pb_fill[:filled_length]
+                        + self._pb_space[filled_length:] + ']')
         # Album Art Display
         album_art_width = min(40, width - 4)
         art_x = 2
         art_y = 2
         ascii_art = []
-        if album_art_image:
-            ascii_art = self.get_ascii_art(album_art_image, album_art_width)
+        art_placeholder = "No Album Art"
+        if album_art_url:
+            ascii_art = self._art_lines_async(album_art_url, album_art_width)
+            if ascii_art is None:
+                ascii_art = []
+                art_placeholder = "Loading Album Art..."
+        if ascii_art:
             for i, line in enumerate(ascii_art):
                 if art_y + i < height - 10:
-                    window.addstr(art_y + i, art_x, line)
+                    put(art_y + i, line)
         else:
-            window.addstr(art_y + 5, art_x + album_art_width // 2 - 5, "No Album Art")
+            put(art_y + 5, " " * (album_art_width // 2 - 5) + art_placeholder)
 
         # Now Playing Info
-        info_x = art_x
-        info_y = art_y + (len(ascii_art) if album_art_image else 10) + 1
+        info_y = art_y + (len(ascii_art) if ascii_art else 10) + 1
         if info_y + 7 < height - 5:
-            window.addstr(info_y, info_x, f"Now Playing: {track_name}")
-            window.addstr(info_y + 1, info_x, f"Artist(s): {artist_names}")
-            window.addstr(info_y + 2, info_x, f"Album: {album_name}")
+            put(info_y, f"Now Playing: {track_name}")
+            put(info_y + 1, f"Artist(s): {artist_names}")
+            put(info_y + 2, f"Album: {album_name}")
             if volume_control_allowed:
-                window.addstr(info_y + 3, info_x, f"Volume: {self.volume}%")
+                put(info_y + 3, f"Volume: {self.volume}%")
             else:
-                window.addstr(info_y + 3, info_x, "Volume: N/A (Cannot control device volume)")
-            window.addstr(info_y + 5, info_x, progress_bar)
-            window.addstr(info_y + 6, info_x, f"{elapsed_str} / {total_str}")
-        # Controls
-        controls = [
-            {"label": "[B] Back", "action": "back"},
-            {"label": "[P] Play/Pause", "action": "play_pause"},
-            {"label": "[N] Next", "action": "next"},
-        ]
-
-        if volume_control_allowed:
-            controls.extend([
-                {"label": "[+] Vol Up", "action": "vol_up"},
-                {"label": "[-] Vol Down", "action": "vol_down"},
-            ])
-
-        controls.append({"label": "[D] Devices", "action": "devices"})
-
-        # Build controls_text and store button positions
-        controls_text = ""
-        self.button_regions.clear()
-        controls_y = height -3
-        controls_x = 2
-
-        for idx, control in enumerate(controls):
-            label = control["label"]
-            action = control["action"]
-
-            if controls_text:
-                controls_text += "  "  # Add spaces between labels
-                controls_x += 2  # Account for spaces
-
-            window.addstr(controls_y, controls_x, label, curses.A_BOLD)
-            self.button_regions[action] = (controls_y, controls_x, len(label))
-            controls_text += label
-            controls_x += len(label)
-
-        window.refresh()
+                put(info_y + 3, "Volume: N/A (Cannot control device volume)")
+            put(info_y + 5, progress_bar)
+            put(info_y + 6, f"{elapsed_str} / {total_str}")
+        # Controls: the row text and clickable regions depend only on the
+        # window size and volume capability, so rebuild them only when
+        # either changes
+        controls_y = height - 3
+        cache_key = (height, width, volume_control_allowed)
+        if self._buttons_cache_key != cache_key:
+            controls = [
+                {"label": "[B] Back", "action": "back"},
+                {"label": "[P] Play/Pause", "action": "play_pause"},
+                {"label": "[N] Next", "action": "next"},
+            ]
+            if volume_control_allowed:
+                controls.extend([
+                    {"label": "[+] Vol Up", "action": "vol_up"},
+                    {"label": "[-] Vol Down", "action": "vol_down"},
+                ])
+            controls.append({"label": "[D] Devices", "action": "devices"})
+
+            controls_text = ""
+            regions = {}
+            controls_x = 2
+            for control in controls:
+                label = control["label"]
+                if controls_text:
+                    controls_text += "  "  # Add spaces between labels
+                    controls_x += 2  # Account for spaces
+                regions[control["action"]] = (controls_y, controls_x, len(label))
+                controls_text += label
+                controls_x += len(label)
+            self._buttons_cache_key = cache_key
+            self._buttons_cache = (controls_text, regions)
+
+        controls_text, self.button_regions = self._buttons_cache
+        put(controls_y, controls_text, curses.A_BOLD)
+        self._paint_frame(window, "player", lines)
 
     def render_devices(self, window):
         """Render the device selection view."""
-        window.clear()
-        window.box()
-        window.addstr(1, 2, "Available Devices:")
         self.get_available_devices()
         max_y, max_x = window.getmaxyx()
         start_y = 3
         visible_items = max_y - start_y - 2
         start_index = max(0, self.selected_index - (visible_items // 2))
         end_index = min(len(self.devices), start_index + visible_items)
+        rows = self._display_strings(
+            'devices', self.devices,
+            lambda device: f"{device['name']} ({device['type']})")
+        lines = [("Available Devices:", 0), ("", 0)]
         for idx in range(start_index, end_index):
-            device = self.devices[idx]
-            display_text = f"{device['name']} ({device['type']})"
-            truncated_text = display_text[:max_x - 4]
-            if idx == self.selected_index:
-                window.addstr(start_y + (idx - start_index), 2, truncated_text, curses.A_REVERSE)
-            else:
-                window.addstr(start_y + (idx - start_index), 2, truncated_text)
-        window.refresh()
+            attr = curses.A_REVERSE if idx == self.selected_index else 0
+            lines.append((rows[idx][:max_x - 4], attr))
+        self._paint_frame(window, "devices", lines)
 
     def get_available_devices(self):
         """Fetch the list of available devices."""
@@ -333,11 +619,9 @@ class SpotifyPlayer:
 
             if not active_devices:
                 # No active devices, display a message
-                self.window.clear()
-                self.window.addstr(2, 2, "No active Spotify devices found.")
-                self.window.addstr(3, 2, "Please open Spotify on a device to play music.")
-                self.window.refresh()
-                time.sleep(3)
+                self._flash_message("No active Spotify devices found.",
+                                    "Please open Spotify on a device to play music.",
+                                    delay=3)
                 self.current_view = "tracks"
                 self.render(self.window)
                 return
@@ -361,21 +645,30 @@ class SpotifyPlayer:
                         # For other exceptions, re-raise the error
                         raise e
 
-                self.current_track = self.sp.track(track_uri)
+                # The tracks list already holds the track object; reuse it
+                # instead of re-fetching the same data from the API
+                if self.explorer_mode == 'playlists':
+                    self.current_track = self.tracks[self.selected_index]['track']
+                else:
+                    # Album endpoints return simplified tracks without an
+                    # album field; graft on the album we navigated in from
+                    track = dict(self.tracks[self.selected_index])
+                    track.setdefault('album', self.current_album)
+                    self.current_track = track
                 self.current_view = "player"
                 self.playback_start_time = time.time()
                 self.player_paused = False
+                self._last_progress_ms = 0
+                self._last_progress_ts = time.monotonic()
                 self.render(self.window)
 
 
         except spotipy.exceptions.SpotifyException as e:
             logging.error(f"Error playing track: {e}")
             self.current_track = None
-            self.window.clear()
-            self.window.addstr(2, 2, "Error playing track.")
-            self.window.addstr(3, 2, "Ensure you have an active Spotify device.")
-            self.window.refresh()
-            time.sleep(3)
+            self._flash_message("Error playing track.",
+                                "Ensure you have an active Spotify device.",
+                                delay=3)
             self.current_view = "tracks"
             self.render(self.window)
 
@@ -392,9 +685,7 @@ class SpotifyPlayer:
             self.render(self.window)
         except spotipy.exceptions.SpotifyException as e:
             logging.error(f"Error toggling playback: {e}")
-            self.window.addstr(2, 2, "Error toggling playback.")
-            self.window.refresh()
-            time.sleep(1)
+            self._flash_message("Error toggling playback.")
 
     def next_track(self):
         """Skip to the next track."""
@@ -403,9 +694,7 @@ class SpotifyPlayer:
             self.update_current_track_info()
         except spotipy.exceptions.SpotifyException as e:
             logging.error(f"Error skipping to next track: {e}")
-            self.window.addstr(2, 2, "Error skipping to next track.")
-            self.window.refresh()
-            time.sleep(1)
+            self._flash_message("Error skipping to next track.")
 
     def previous_track(self):
         """Go back to the previous track."""
@@ -414,35 +703,38 @@ class SpotifyPlayer:
             self.update_current_track_info()
         except spotipy.exceptions.SpotifyException as e:
             logging.error(f"Error going to previous track: {e}")
-            self.window.addstr(2, 2, "Error going to previous track.")
-            self.window.refresh()
-            time.sleep(1)
+            self._flash_message("Error going to previous track.")
 
     def increase_volume(self):
         """Increase the playback volume."""
-        self.volume = min(100, self.volume + 10)
-        try:
-            if self.current_device:
-                self.sp.volume(self.volume, device_id=self.current_device['id'])
-            else:
-                self.sp.volume(self.volume)
-        except spotipy.exceptions.SpotifyException as e:
-            logging.error(f"Error setting volume: {e}")
-            # Handle VOLUME_CONTROL_DISALLOW gracefully
-            if 'VOLUME_CONTROL_DISALLOW' in str(e):
-                logging.info("Volume control is not allowed on this device.")
-                # Inform the user
-                self.window.addstr(2, 2, "Cannot control device volume.")
-                self.window.refresh()
-                time.sleep(1)
-            else:
-                # For other exceptions, re-raise the error
-                raise e
-        self.render(self.window)
+        self._change_volume(10)
 
     def decrease_volume(self):
         """Decrease the playback volume."""
-        self.volume = max(0, self.volume - 10)
+        self._change_volume(-10)
+
+    def _change_volume(self, delta):
+        """Apply a volume step locally and debounce the Web-API write.
+
+        The display updates immediately; the API call fires 150 ms after
+        the last step, so a held key sends one request instead of one per
+        key repeat.
+        """
+        self.volume = max(0, min(100, self.volume + delta))
+        if self._vol_timer is not None:
+            self._vol_timer.cancel()
+        self._vol_timer = threading.Timer(0.15, self._flush_volume)
+        self._vol_timer.daemon = True
+        self._vol_timer.start()
+        self.render(self.window)
+
+    def _flush_volume(self):
+        """Send the settled volume to the Web API.
+
+        Runs on a Timer thread, so errors are reported instead of raised:
+        an exception here would land in the thread's unhandled hook and
+        scribble a traceback over the curses screen.
+        """
         try:
             if self.current_device:
                 self.sp.volume(self.volume, device_id=self.current_device['id'])
@@ -454,22 +746,30 @@ class SpotifyPlayer:
             if 'VOLUME_CONTROL_DISALLOW' in str(e):
                 logging.info("Volume control is not allowed on this device.")
                 # Inform the user
-                self.window.addstr(2, 2, "Cannot control device volume.")
-                self.window.refresh()
-                time.sleep(1)
+                self._flash_message("Cannot control device volume.")
             else:
-                # For other exceptions, re-raise the error
-                raise e
-        self.render(self.window)
+                self._flash_message("Error setting volume.")
 
     def update_current_track_info(self):
-        """Update the current track information."""
+        """Update the current track information, rendering only on change."""
+        state = None
         try:
             playback_info = self.sp.current_playback()
             if playback_info and playback_info['item']:
                 self.current_track = playback_info['item']
                 if 'device' in playback_info and playback_info['device']:
                     self.current_device = playback_info['device']
+                state = (self.current_track['id'],
+                         playback_info.get('is_playing'),
+                         (playback_info.get('progress_ms') or 0) // 1000)
+                self._last_progress_ms = playback_info.get('progress_ms') or 0
+                self._last_progress_ts = time.monotonic()
+                self.player_paused = not playback_info.get('is_playing')
+                # Warm the art cache at the usual render width so the player
+                # view opens with the art already converted
+                images = self.current_track['album']['images']
+                if images:
+                    self._art_lines_async(images[0]['url'], 40)
             else:
                 self.current_track = None
                 self.current_device = None
@@ -477,19 +777,32 @@ class SpotifyPlayer:
             logging.error(f"Error updating current track info: {e}")
             self.current_track = None
             self.current_device = None
-        self.render(self.window)
+        if state != self._last_pb_state and self.window is not None:
+            self._last_pb_state = state
+            self.render(self.window)
+            curses.doupdate()
 
     def handle_keypress(self, key):
         """Handle keypress actions based on current view."""
-        if self.current_view == "explorer":
-            return self.handle_explorer_keypress(key)
-        elif self.current_view == "tracks":
-            return self.handle_tracks_keypress(key)
-        elif self.current_view == "player":
-            return self.handle_player_keypress(key)
-        elif self.current_view == "devices":
-            return self.handle_devices_keypress(key)
-        return False
+        view = self.current_view
+        if view == "explorer":
+            handled = self.handle_explorer_keypress(key)
+        elif view == "tracks":
+            handled = self.handle_tracks_keypress(key)
+        elif view == "player":
+            handled = self.handle_player_keypress(key)
+        elif view == "devices":
+            handled = self.handle_devices_keypress(key)
+        else:
+            return False
+        if self.current_view != view:
+            # Entering or leaving the player changes the poll cadence; wake
+            # the playback thread so it re-evaluates right away.
+            self._wake.set()
+        if handled:
+            # Renders above only staged their windows; flush once per key
+            curses.doupdate()
+        return handled
 
     def handle_explorer_keypress(self, key):
         handled = False
@@ -535,9 +848,7 @@ class SpotifyPlayer:
                 self.render(self.window)
             else:
                 # Optionally display a message
-                self.window.addstr(2, 2, "No song is currently playing.")
-                self.window.refresh()
-                time.sleep(1)
+                self._flash_message("No song is currently playing.")
                 self.render_explorer(self.window)
             handled = True
         elif key in (curses.KEY_BACKSPACE, ord('\b'), 127):
@@ -578,9 +889,7 @@ class SpotifyPlayer:
                 self.render(self.window)
             else:
                 # Optionally display a message
-                self.window.addstr(2, 2, "No song is currently playing.")
-                self.window.refresh()
-                time.sleep(1)
+                self._flash_message("No song is currently playing.")
                 self.render_tracks(self.window)
             handled = True
         elif key in (curses.KEY_BACKSPACE, ord('\b'), 127):
@@ -668,23 +977,107 @@ class SpotifyPlayer:
                         self.render(self.window)
                     break
 
+    def _maybe_refresh_token(self):
+        """Refresh the OAuth token shortly before expiry, off the key path.
+
+        Checked at most once a minute so an expiring token never forces a
+        blocking refresh in the middle of a keypress-triggered API call.
+        """
+        now = time.time()
+        if self.sp is None or now - self._token_checked_at < 60:
+            return
+        self._token_checked_at = now
+        try:
+            auth = self.sp.auth_manager
+            token = auth.get_cached_token()
+            if token and token['expires_at'] - now < 60:
+                auth.refresh_access_token(token['refresh_token'])
+                logging.debug("Proactively refreshed Spotify access token")
+        except Exception as e:
+            logging.error(f"Proactive token refresh failed: {e}")
+
     def update_playback_info(self):
-        """Continuously update playback information."""
-        while True:
-            #if self.current_view == "player":
+        """Continuously update playback information until told to stop."""
+        while not self._stop.is_set():
+            self._maybe_refresh_token()
             self.update_current_track_info()
-            time.sleep(1)
+            # The player view needs second-resolution progress; the other
+            # views only need to notice track changes, so poll them lazily.
+            interval = 1 if self.current_view == "player" else 5
+            self._wake.wait(timeout=interval)
+            self._wake.clear()
+
+    _ART_IMAGE_CACHE_SIZE = 64
+    _ASCII_CACHE_SIZE = 32
+
+    def _art_lines_async(self, url, width):
+        """Return cached ASCII art, scheduling a background fetch on a miss.
+
+        Returns None while the fetch is in flight; the caller paints a
+        placeholder and the playback poller repaints once the worker has
+        warmed the cache.
+        """
+        key = (url, width)
+        cached = self._ascii_cache.get(key)
+        if cached is not None:
+            self._ascii_cache.move_to_end(key)
+            return cached
+        if key not in self._art_pending:
+            self._art_pending.add(key)
+            self._art_executor.submit(self._prefetch_art, url, width)
+        return None
+
+    def _prefetch_art(self, url, width):
+        try:
+            self._ascii_art_cached(url, width)
+        finally:
+            self._art_pending.discard((url, width))
+            # Invalidate the poller's change detection: with playback
+            # paused the state tuple is static, and waking alone would
+            # leave the loading placeholder on screen
+            self._last_pb_state = None
+            self._wake.set()  # repaint promptly now that the art is ready
+
+    def _ascii_art_cached(self, url, width):
+        """Return the ASCII art lines for an album-art URL at a width.
+
+        LRU-cached on (url, width) so only the first render of a new track
+        (or a resize) pays for the download and conversion.
+        """
+        key = (url, width)
+        cached = self._ascii_cache.get(key)
+        if cached is not None:
+            self._ascii_cache.move_to_end(key)
+            return cached
+        image = self.get_album_art_image(url)
+        if image is None:
+            return []
+        # Store the rows pre-encoded: curses accepts bytes directly, so
+        # repaints skip the per-addstr string encode, and the cached objects
+        # compare by identity in the frame diff
+        lines = [line.encode('ascii') for line in self.get_ascii_art(image, width)]
+        self._ascii_cache[key] = lines
+        if len(self._ascii_cache) > self._ASCII_CACHE_SIZE:
+            self._ascii_cache.popitem(last=False)
+        return lines
 
     def get_album_art_image(self, url):
-        """Download and return the album art image."""
+        """Download and return the album art image, cached by URL."""
+        cached = self._art_image_cache.get(url)
+        if cached is not None:
+            self._art_image_cache.move_to_end(url)
+            return cached
         try:
-            response = requests.get(url)
+            response = self.http.get(url, timeout=(3, 5))
             if response.status_code != 200:
                 logging.error(f"Failed to download album art, status code: {response.status_code}")
                 return None
             img_data = response.content
             image = Image.open(io.BytesIO(img_data))
             logging.debug("Album art image downloaded successfully")
+            self._art_image_cache[url] = image
+            if len(self._art_image_cache) > self._ART_IMAGE_CACHE_SIZE:
+                self._art_image_cache.popitem(last=False)
             return image
         except Exception as e:
             logging.error(f"Error downloading album art: {e}")
@@ -695,14 +1088,28 @@ class SpotifyPlayer:
         # Resize image maintaining aspect ratio
         aspect_ratio = img.height / img.width
         new_height = int(aspect_ratio * width * 0.55)  # Adjust for terminal character dimensions
-        img = img.resize((width, new_height))
-        img = img.convert('L')  # Convert to grayscale
-        pixels = img.getdata()
-        chars = ["@", "#", "S", "%", "?", "*", "+", ";", ":", ",", "."]
-        new_pixels = [chars[int(pixel / 255 * (len(chars) - 1))] for pixel in pixels]
-        ascii_art = [''.join(new_pixels[i:i+width]) for i in range(0, len(new_pixels), width)]
-        return ascii_art
+        # Grayscale first: resampling then works on one channel instead of
+        # three (or four), and BILINEAR is plenty for a character grid
+        img = img.convert('L')
+        img = img.resize((width, new_height), Image.Resampling.BILINEAR)
+        # One table lookup per pixel via the precomputed LUT
+        arr = np.asarray(img, dtype=np.uint8)
+        return [''.join(row) for row in _PIX_LUT[arr]]
+
+    def close(self):
+        """Stop the playback poller and release the worker pools."""
+        self._stop.set()
+        self._wake.set()
+        if self._vol_timer is not None:
+            self._vol_timer.cancel()
+        self.update_playback_thread.join(timeout=2)
+        self._api_executor.shutdown(wait=False)
+        self._art_executor.shutdown(wait=False)
 
     def cleanup(self):
         """Clean up resources before exiting."""
-        self.sp.pause_playback()
+        try:
+            self.sp.pause_playback()
+        except Exception as e:
+            logging.error(f"Error pausing playback on exit: {e}")
+        self.close()